@@ -1,3 +1,4 @@
+import json
 import shutil
 from pathlib import Path
 import subprocess
@@ -7,31 +8,75 @@ Import("env")
 
 SRC = Path("src/web")
 DST = Path("src/web/build")
+DRIVER = DST / "minify_driver.mjs"
+# Exit status of the driver when it can't load the minifier libraries
+# (keep in sync with minify_driver.mjs)
+DRIVER_UNAVAILABLE = 3
 
 DST.mkdir(exist_ok=True)
 
 
-def command_exists(cmd):
-    """Check if a command is available."""
-    try:
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, check=False, timeout=1
+def run(cmd):
+    subprocess.check_call(cmd, shell=True)
+
+
+def minify_cli(job):
+    """Per-file fallback through the minifier CLIs (one Node startup each)."""
+    f, out = job["in"], job["out"]
+    if job["kind"] == "html":
+        run(
+            f'html-minifier-terser "{f}" '
+            "--collapse-whitespace "
+            "--remove-comments "
+            "--minify-css true "
+            "--minify-js true "
+            f'-o "{out}"'
+        )
+    elif job["kind"] == "css":
+        run(f'cleancss -O2 "{f}" -o "{out}"')
+    elif job["kind"] == "js":
+        toplevel = " --toplevel" if job["toplevel"] else ""
+        run(
+            f'terser "{f}" --compress --mangle --comments false --ecma 2020{toplevel} -o "{out}"'
         )
-        return result.returncode == 0
-    except:
-        return False
 
 
-def run(cmd):
-    subprocess.check_call(cmd, shell=True)
+def minify_all(jobs):
+    """Minify all jobs in one Node process (avoids a Node startup per file).
 
+    Returns False without touching any file when node is missing or the
+    driver can't load the minifier libraries.
+    """
+    if not jobs:
+        return True
+    payload = "".join(json.dumps(job) + "\n" for job in jobs)
+    try:
+        proc = subprocess.Popen(
+            ["node", str(DRIVER)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+    except OSError:
+        return False
+    try:
+        out, _ = proc.communicate(payload)
+    except BrokenPipeError:
+        # Driver exited before reading its jobs
+        proc.wait()
+        out = ""
+    if proc.returncode == DRIVER_UNAVAILABLE:
+        return False
+    results = [json.loads(line) for line in out.splitlines() if line.strip()]
+    failed = [r for r in results if r["error"]]
+    for r in failed:
+        print(f"Error: minifying {r['in']} failed: {r['error']}", file=sys.stderr)
+    if proc.returncode != 0 or failed or len(results) != len(jobs):
+        raise subprocess.CalledProcessError(proc.returncode or 1, ["node", str(DRIVER)])
+    return True
 
-# Check which minifiers are available
-has_html_minifier = command_exists("html-minifier-terser --version")
-has_cleancss = command_exists("cleancss --version")
-has_terser = command_exists("terser --version")
 
-if not (has_html_minifier and has_cleancss and has_terser):
+def warn_missing():
     print("Warning: Minifiers not found. Skipping minification.", file=sys.stderr)
     if not has_html_minifier:
         print("  - html-minifier-terser: not installed", file=sys.stderr)
@@ -43,8 +88,20 @@ if not (has_html_minifier and has_cleancss and has_terser):
         "To enable minification, install: npm install -g html-minifier-terser clean-css-cli terser",
         file=sys.stderr,
     )
+
+
+# Check which minifiers are available (PATH lookup only, no process spawn)
+has_html_minifier = shutil.which("html-minifier-terser") is not None
+has_cleancss = shutil.which("cleancss") is not None
+has_terser = shutil.which("terser") is not None
+has_cli = has_html_minifier and has_cleancss and has_terser
+
+if not has_cli and shutil.which("node") is None:
+    warn_missing()
 else:
     # Recursively process all files, minifying where possible
+    jobs = []
+    copies = []
     for f in sorted(SRC.rglob("*")):
         if not f.is_file():
             continue
@@ -61,26 +118,33 @@ else:
         out.parent.mkdir(parents=True, exist_ok=True)
 
         if f.suffix == ".html":
-            run(
-                f'html-minifier-terser "{f}" '
-                "--collapse-whitespace "
-                "--remove-comments "
-                "--minify-css true "
-                "--minify-js true "
-                f'-o "{out}"'
-            )
+            jobs.append({"in": str(f), "out": str(out), "kind": "html"})
 
         elif f.suffix == ".css":
-            run(f'cleancss -O2 "{f}" -o "{out}"')
+            jobs.append({"in": str(f), "out": str(out), "kind": "css"})
 
         elif f.suffix == ".js":
-            # Skip --toplevel for chess.js: it exposes globals that board.html depends on
-            toplevel = "" if f.name == "chess.js" else " --toplevel"
-            run(
-                f'terser "{f}" --compress --mangle --comments false --ecma 2020{toplevel} -o "{out}"'
+            # Skip toplevel for chess.js: it exposes globals that board.html depends on
+            toplevel = f.name != "chess.js"
+            jobs.append(
+                {"in": str(f), "out": str(out), "kind": "js", "toplevel": toplevel}
             )
 
         else:
+            copies.append((f, out))
+
+    # Prefer the batch driver; it needs the libraries from 'npm root -g'.
+    # Otherwise fall back to the CLIs on PATH (pnpm/yarn/volta globals, local bins).
+    minified = minify_all(jobs)
+    if not minified and has_cli:
+        for job in jobs:
+            minify_cli(job)
+        minified = True
+
+    if minified:
+        # Copy the rest only now, so a skipped run leaves no partial build/
+        for f, out in copies:
             shutil.copy(f, out)
-
-    print("Web assets minified")
+        print("Web assets minified")
+    else:
+        warn_missing()
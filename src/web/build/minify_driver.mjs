@@ -0,0 +1,74 @@
+// Batch minifier used by minify.py: minifies every web asset in a single Node
+// process instead of launching one CLI per file.
+//
+// Reads one JSON job per line on stdin:
+//   {"in": "src/web/index.html", "out": "src/web/build/index.html", "kind": "html"}
+//   {"in": "...", "out": "...", "kind": "js", "toplevel": true}
+// and writes one JSON result per line on stdout: {"in": ..., "error": null|string}
+//
+// Exits with status 3 before reading any job if the minifiers can't be
+// loaded, so minify.py can fall back to the CLIs.
+
+import { execSync } from "node:child_process";
+import { readFile, writeFile } from "node:fs/promises";
+import { createRequire } from "node:module";
+import path from "node:path";
+import { createInterface } from "node:readline";
+
+let globalRoot = null;
+
+// The minifiers are normally installed globally (npm install -g ...), which
+// bare imports don't search. Resolve them with require() from the global npm
+// root instead; clean-css ships as a dependency of clean-css-cli.
+function load(name, host = "") {
+  try {
+    return createRequire(import.meta.url)(name);
+  } catch {
+    if (globalRoot === null) globalRoot = execSync("npm root -g", { encoding: "utf8" }).trim();
+    return createRequire(path.join(globalRoot, host, "noop.js"))(name);
+  }
+}
+
+// Keep in sync with DRIVER_UNAVAILABLE in minify.py
+const DRIVER_UNAVAILABLE = 3;
+
+let minifyHtml, CleanCSS, minifyJs;
+try {
+  ({ minify: minifyHtml } = load("html-minifier-terser"));
+  CleanCSS = load("clean-css", "clean-css-cli");
+  ({ minify: minifyJs } = load("terser"));
+} catch (e) {
+  console.error(`minify_driver: ${e.message.split("\n")[0]}`);
+  process.exit(DRIVER_UNAVAILABLE);
+}
+
+// Same options minify.py used to pass on the command line
+async function run(job) {
+  const src = await readFile(job.in, "utf8");
+  let out;
+  if (job.kind === "html") {
+    out = await minifyHtml(src, { collapseWhitespace: true, removeComments: true, minifyCSS: true, minifyJS: true });
+  } else if (job.kind === "css") {
+    const result = new CleanCSS({ level: 2 }).minify(src);
+    if (result.errors.length) throw new Error(result.errors.join("; "));
+    out = result.styles;
+  } else if (job.kind === "js") {
+    const result = await minifyJs(src, { compress: true, mangle: true, ecma: 2020, toplevel: !!job.toplevel, format: { comments: false } });
+    out = result.code;
+  } else {
+    throw new Error(`unknown kind: ${job.kind}`);
+  }
+  await writeFile(job.out, out);
+}
+
+for await (const line of createInterface({ input: process.stdin })) {
+  if (!line.trim()) continue;
+  const job = JSON.parse(line);
+  let error = null;
+  try {
+    await run(job);
+  } catch (e) {
+    error = String(e && e.message ? e.message : e);
+  }
+  process.stdout.write(JSON.stringify({ in: job.in, error }) + "\n");
+}
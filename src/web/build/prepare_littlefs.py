@@ -3,73 +3,257 @@ Pre-build script: Gzip-compress minified web assets and place them
 in the data/ directory for LittleFS filesystem upload.
 
 Files with '.nogz.' in the name are copied as-is (no gzip).
-All other supported files are gzip-compressed and stored with a .gz suffix.
+All other supported files are gzip-compressed and stored with a .gz suffix,
+unless gzip would not make them smaller (tiny files), in which case they
+are stored as-is too.
+The gzip level defaults to 6 and can be overridden with OCM_GZIP_LEVEL;
+files with '.max.' in the name always use level 9. Both '.nogz.' and
+'.max.' are stripped from the name in data/ (app.max.js -> app.js.gz).
+Setting OCM_COMPRESS=zopfli produces smaller gzip streams (requires the
+'zopfli' Python package) at the cost of a much slower build.
 ESPAsyncWebServer's serveStatic automatically detects .gz files and
 serves them with Content-Encoding: gzip.
+
+Unchanged sources (by SHA-256, tracked in .build_cache/littlefs.json) are
+not recompressed, and their files in data/ are left untouched.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import gzip
+import hashlib
+import json
+import os
 import shutil
 import sys
 
+try:
+    import zopfli.gzip
+except ImportError:
+    zopfli = None
+
 Import("env")
 
 BUILD_DIR = Path("src/web/build")
 DATA_DIR = Path("data")
+CACHE_DIR = Path(".build_cache")
+MANIFEST_FILE = CACHE_DIR / "littlefs.json"
 
 SUPPORTED_EXTENSIONS = {".html", ".css", ".js", ".svg", ".mp3"}
 
+GZIP_LEVEL_DEFAULT = 6
+GZIP_LEVEL_MAX = 9
+GZIP_OVERHEAD = 18  # gzip header + CRC32/size trailer
+
+COMPRESS = os.environ.get("OCM_COMPRESS", "gzip")
+COMPRESS_CHOICES = {"gzip", "zopfli"}
+
 
 def is_nogz(filename: str) -> bool:
     return ".nogz." in filename
 
 
-def prepare():
-    # Clean and recreate data directory
-    if DATA_DIR.exists():
-        shutil.rmtree(DATA_DIR)
-    DATA_DIR.mkdir()
-
-    count = 0
-
-    for f in sorted(BUILD_DIR.rglob("*")):
-        if not f.is_file():
-            continue
-
-        ext = f.suffix.lower()
-        if ext not in SUPPORTED_EXTENSIONS:
-            continue
-
-        # Get path relative to build dir and clean .nogz. from name
-        rel = f.relative_to(BUILD_DIR)
-        clean_name = str(rel).replace("\\", "/").replace(".nogz", "")
-
-        if is_nogz(f.name):
-            # Binary files that don't benefit from gzip — copy as-is
-            out = DATA_DIR / clean_name
-            out.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(f, out)
-        else:
+def is_max(filename: str) -> bool:
+    return ".max." in filename
+
+
+def gzip_level() -> int:
+    """Read OCM_GZIP_LEVEL, falling back to the default on invalid values."""
+    value = os.environ.get("OCM_GZIP_LEVEL", str(GZIP_LEVEL_DEFAULT))
+    try:
+        level = int(value)
+    except ValueError:
+        level = -1
+    if not 0 <= level <= 9:
+        print(
+            f"Warning: invalid OCM_GZIP_LEVEL={value!r} (expected 0-9), "
+            f"using {GZIP_LEVEL_DEFAULT}.",
+            file=sys.stderr,
+        )
+        return GZIP_LEVEL_DEFAULT
+    return level
+
+
+def encoding_for(filename: str, level: int) -> str:
+    """Describe how a file is stored; used both as cache key and by compress()."""
+    if is_nogz(filename):
+        return "raw"
+    if COMPRESS == "zopfli" and zopfli is not None:
+        return "zopfli"
+    # Level 9 only pays off where flash size matters more than build time
+    return f"gzip-{GZIP_LEVEL_MAX if is_max(filename) else level}"
+
+
+def compress(raw: bytes, encoding: str) -> bytes:
+    # Browsers only advertise br/zstd over HTTPS, so the board has to serve
+    # gzip; zopfli squeezes more out of the same format when flash is tight.
+    if encoding == "zopfli":
+        return zopfli.gzip.compress(raw)
+    level = int(encoding.split("-")[1])
+    return gzip.compress(raw, compresslevel=level, mtime=0)
+
+
+def load_manifest() -> dict:
+    try:
+        return json.loads(MANIFEST_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict):
+    CACHE_DIR.mkdir(exist_ok=True)
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+
+
+def write_if_changed(path: Path, data: bytes):
+    """Only touch files whose bytes differ, so their mtime stays stable."""
+    if path.is_file() and path.read_bytes() == data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def warn_duplicates(manifest: dict):
+    """Report assets with identical content; each copy costs flash in LittleFS."""
+    seen = {}
+    for name, entry in manifest.items():
+        first = seen.setdefault(entry["sha256"], name)
+        if first != name:
+            print(
+                f"Warning: {name} is identical to {first} and is stored twice "
+                "(LittleFS has no links) — reference one copy instead.",
+                file=sys.stderr,
+            )
+
+
+def remove_stale(keep: set):
+    """Delete files in data/ that no longer correspond to a web asset."""
+    for entry in sorted(DATA_DIR.rglob("*"), reverse=True):
+        if entry.is_file() and entry not in keep:
+            entry.unlink()
+        elif entry.is_dir() and not any(entry.iterdir()):
+            entry.rmdir()
+
+
+def clean_name_for(f: Path) -> str:
+    """Path relative to the build dir with .nogz./.max. removed, as served."""
+    rel = f.relative_to(BUILD_DIR)
+    return str(rel).replace("\\", "/").replace(".nogz", "").replace(".max.", ".")
+
+
+def prepare_one(f: Path, previous: dict, level: int):
+    """Compress (or copy) one asset into data/. Runs in a worker thread."""
+    clean_name = clean_name_for(f)
+
+    raw = f.read_bytes()
+    entry = {
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "encoding": encoding_for(f.name, level),
+    }
+
+    old = previous.get(clean_name, {})
+    out = DATA_DIR / old.get("file", clean_name)
+    if (
+        old.get("sha256") == entry["sha256"]
+        and old.get("encoding") == entry["encoding"]
+        and out.is_file()
+        and out.stat().st_size == old.get("size")
+    ):
+        return clean_name, out, old, True
+
+    # Binary files that don't benefit from gzip — copy as-is
+    data = raw
+    out = DATA_DIR / clean_name
+    if entry["encoding"] != "raw":
+        compressed = compress(raw, entry["encoding"])
+        # Tiny files can grow once the gzip header and trailer are added,
+        # those are stored uncompressed instead
+        if len(compressed) < len(raw) - GZIP_OVERHEAD:
+            data = compressed
             # Gzip compress — ESPAsyncWebServer finds .gz automatically
             out = DATA_DIR / (clean_name + ".gz")
-            out.parent.mkdir(parents=True, exist_ok=True)
-            raw = f.read_bytes()
-            compressed = gzip.compress(raw, compresslevel=9, mtime=0)
-            out.write_bytes(compressed)
 
-        count += 1
+    write_if_changed(out, data)
+    entry.update(file=out.relative_to(DATA_DIR).as_posix(), size=len(data))
+    return clean_name, out, entry, False
+
+
+def prepare():
+    DATA_DIR.mkdir(exist_ok=True)
+
+    if COMPRESS not in COMPRESS_CHOICES:
+        print(
+            f"Warning: unsupported OCM_COMPRESS={COMPRESS!r}, using gzip.",
+            file=sys.stderr,
+        )
+        print(
+            "Only gzip and zopfli are supported: browsers only accept br/zstd "
+            "over HTTPS, and the board serves plain HTTP.",
+            file=sys.stderr,
+        )
+    elif COMPRESS == "zopfli" and zopfli is None:
+        print(
+            "Warning: OCM_COMPRESS=zopfli but zopfli is not installed, using gzip.",
+            file=sys.stderr,
+        )
+        print("Install it with: pip install zopfli", file=sys.stderr)
+    level = gzip_level()
+
+    files = [
+        f
+        for f in sorted(BUILD_DIR.rglob("*"))
+        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
+    ]
+
+    # e.g. app.js and app.max.js both map to data/app.js.gz; two workers would
+    # race on that file and the manifest would keep an arbitrary result
+    sources = {}
+    for f in files:
+        sources.setdefault(clean_name_for(f), []).append(f)
+    clashes = {name: fs for name, fs in sources.items() if len(fs) > 1}
+    if clashes:
+        for name, fs in clashes.items():
+            names = ", ".join(str(f.relative_to(BUILD_DIR)) for f in fs)
+            print(f"Error: {names} would all be served as {name}", file=sys.stderr)
+        print("Rename one of them; data/ was left unchanged.", file=sys.stderr)
+        sys.exit(1)
+
+    # Content-hash manifest from the previous run (mtimes are useless after a
+    # git checkout, so unchanged sources are detected by SHA-256 instead)
+    previous = load_manifest()
+    manifest = {}
+    outputs = set()
+    count = len(files)
+    cached = 0
+
+    # zlib releases the GIL while compressing, so threads scale across cores
+    with ThreadPoolExecutor() as pool:
+        results = pool.map(lambda f: prepare_one(f, previous, level), files)
+        for f, (clean_name, out, entry, was_cached) in zip(files, results):
+            manifest[clean_name] = entry
+            outputs.add(out)
+            cached += was_cached
+            if not is_nogz(f.name) and out.suffix != ".gz":
+                print(
+                    f"Warning: {clean_name} does not shrink with gzip, stored "
+                    "uncompressed (add .nogz. to its name to skip compression).",
+                    file=sys.stderr,
+                )
+
+    warn_duplicates(manifest)
+    remove_stale(outputs)
+    save_manifest(manifest)
 
     # Clean up minified files and copied directories from build/
     for entry in sorted(BUILD_DIR.iterdir(), reverse=True):
-        if entry.name.startswith(".") or entry.suffix == ".py":
+        if entry.name.startswith(".") or entry.suffix in (".py", ".mjs"):
             continue  # keep .gitignore and build scripts
         if entry.is_dir():
             shutil.rmtree(entry)
         elif entry.is_file():
             entry.unlink()
 
-    print(f"LittleFS: Prepared {count} web assets in data/")
+    print(f"LittleFS: Prepared {count} web assets in data/ ({cached} unchanged)")
 
 
 # Only run if minified files exist in build/
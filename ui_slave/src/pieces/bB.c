@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_BB
-uint8_t bB_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x53,0x45,0x29,0xd9,0x45,0x29,0xe2,0x45,0x29,0x67,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x29,0x65,0x29,0xeb,0x08,0x42,0xff,0x08,0x42,0xff,0x45,0x29,0xb6,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x68,0xc7,0x39,0xfe,0x28,0x4a,0xff,0xe7,0x41,0xff,0x45,0x29,0x9b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x4d,0xa6,0x31,0xf2,0x28,0x4a,0xff,0xc7,0x39,0xf8,0x45,0x29,0x5e,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x7d,0x86,0x31,0xf0,0x28,0x4a,0xff,0x65,0x31,0xe8,0x24,0x21,0x21,0x24,0x21,0x35,0x65,0x29,0x17,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x45,0x29,0x91,0x86,0x31,0xee,0x28,0x4a,0xff,0x28,0x42,0xff,0x45,0x29,0xe0,0x00,0x00,0x00,0x24,0x21,0xcb,0x24,0x21,0xe5,0x45,0x29,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x8d,0xa6,0x31,0xf2,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xfe,0x65,0x29,0x92,0x45,0x29,0x18,0x04,0x21,0xed,0x65,0x29,0xff,0x24,0x21,0xe8,0x24,0x21,0x1a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5a,0x86,0x31,0xee,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xea,0x45,0x29,0x33,0x45,0x29,0x75,0x65,0x31,0xfc,0x86,0x31,0xff,0x65,0x29,0xfe,0x24,0x21,0xd3,0x08,0x42,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x16,0x65,0x29,0xe9,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x65,0x29,0xe4,0x00,0x00,0x01,0x45,0x29,0xce,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x29,0xf7,0x45,0x29,0x77,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xa5,0xe7,0x39,0xfc,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x07,0x42,0xff,0x45,0x29,0xb6,0x45,0x29,0x06,0x65,0x29,0xe8,0x28,0x4a,0xff,0xe7,0x39,0xff,0x86,0x31,0xff,0x85,0x31,0xff,0x24,0x21,0xe9,0x24,0x21,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x08,0x65,0x29,0xe8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xfc,0x45,0x29,0x6c,0x45,0x29,0x38,0x86,0x31,0xec,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xf4,0x45,0x29,0x46,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x43,0xa6,0x31,0xef,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xf4,0x24,0x21,0x4f,0x45,0x29,0x79,0xc7,0x39,0xfd,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xff,0x45,0x29,0x96,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5e,0xc7,0x39,0xfc,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc6,0x39,0xf6,0x45,0x29,0xe9,0x45,0x29,0xf2,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xff,0x86,0x31,0xff,0x65,0x29,0xff,0x24,0x21,0xb5,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5a,0xc6,0x39,0xf9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xff,0x86,0x31,0xff,0x65,0x29,0xff,0x45,0x29,0xb0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x27,0x86,0x31,0xe9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xfb,0x45,0x29,0x6c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xdf,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x07,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xed,0x45,0x29,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5c,0xa6,0x31,0xf1,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xff,0x86,0x31,0xff,0x45,0x29,0xfd,0x45,0x29,0xad,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x45,0x29,0xc8,0xe7,0x39,0xfd,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xff,0x86,0x31,0xff,0x65,0x29,0xff,0x24,0x21,0xe4,0x24,0x21,0x14,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x47,0x45,0x29,0xd8,0x65,0x29,0xea,0x65,0x29,0xfa,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x45,0x29,0xff,0x24,0x21,0xff,0x04,0x21,0xfb,0x24,0x21,0xea,0x24,0x21,0xd8,0x45,0x29,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x8a,0x86,0x31,0xed,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xf1,0x45,0x29,0x8b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x3c,0x86,0x31,0xed,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xf1,0x24,0x21,0x3c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x64,0xc7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xff,0x45,0x29,0x64,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x64,0xc7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xff,0x45,0x29,0x64,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x56,0x45,0x29,0xe3,0x65,0x29,0xdf,0x65,0x29,0xe1,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x24,0x21,0xe7,0x24,0x21,0xe3,0x24,0x21,0xe7,0x24,0x21,0x56,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t bB_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x53\x45\x29\xd9\x45\x29\xe2\x45\x29"
+    "\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x29\x65"
+    "\x29\xeb\x08\x42\xff\x08\x42\xff\x45\x29\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x45\x29\x68\xc7\x39\xfe\x28\x4a\xff\xe7\x41\xff\x45\x29\x9b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x4d\xa6\x31\xf2\x28\x4a\xff\xc7\x39\xf8\x45\x29\x5e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x7d\x86\x31\xf0\x28\x4a\xff\x65\x31\xe8\x24\x21\x21\x24\x21\x35\x65\x29\x17\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x45\x29\x91\x86\x31\xee\x28\x4a\xff\x28\x42\xff\x45\x29\xe0\x00\x00\x00\x24\x21\xcb\x24\x21\xe5\x45\x29\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x8d\xa6\x31\xf2\x28\x4a\xff\x28\x4a\xff\xe7\x39\xfe\x65\x29\x92\x45\x29\x18\x04\x21\xed\x65\x29\xff\x24\x21\xe8\x24\x21\x1a\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5a\x86\x31\xee\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xea\x45\x29\x33\x45\x29\x75\x65\x31\xfc\x86\x31\xff\x65\x29\xfe"
+    "\x24\x21\xd3\x08\x42\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x16\x65\x29\xe9\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x65\x29\xe4\x00\x00\x01\x45\x29"
+    "\xce\x08\x42\xff\x86\x31\xff\x86\x31\xff\x24\x29\xf7\x45\x29\x77\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xa5\xe7\x39\xfc\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x07"
+    "\x42\xff\x45\x29\xb6\x45\x29\x06\x65\x29\xe8\x28\x4a\xff\xe7\x39\xff\x86\x31\xff\x85\x31\xff\x24\x21\xe9\x24\x21\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x08\x65\x29\xe8\x28\x4a\xff"
+    "\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xfc\x45\x29\x6c\x45\x29\x38\x86\x31\xec\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x86\x31\xff\x24\x21\xf4\x45\x29\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x45\x29\x43\xa6\x31\xef\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xf4\x24\x21\x4f\x45\x29\x79\xc7\x39\xfd\x28\x4a\xff\x28\x4a\xff\xa6\x31\xff\x86\x31\xff\x45\x29\xff\x45\x29\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5e\xc7\x39\xfc\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc6\x39\xf6\x45\x29\xe9\x45\x29\xf2\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xff\x86\x31\xff\x65\x29\xff\x24\x21\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5a\xc6\x39\xf9\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xff\x86\x31\xff\x65\x29\xff\x45\x29\xb0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x27\x86\x31\xe9\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x45\x29\xfb\x45\x29\x6c\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xdf\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x07\x42\xff\x86\x31\xff"
+    "\x86\x31\xff\x24\x21\xed\x45\x29\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5c\xa6\x31\xf1\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\xa6\x39\xff\x86\x31\xff\x45\x29\xfd\x45\x29\xad\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x45\x29\xc8\xe7\x39\xfd\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xff\x86\x31\xff\x65\x29\xff\x24\x21\xe4\x24\x21\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x47\x45\x29\xd8\x65\x29\xea"
+    "\x65\x29\xfa\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x45\x29\xff\x24\x21\xff\x04\x21\xfb\x24\x21\xea\x24\x21\xd8\x45\x29\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29"
+    "\x8a\x86\x31\xed\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x65\x31\xff\x24\x21\xf1\x45\x29\x8b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x24\x21\x3c\x86\x31\xed\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x86\x31\xff\x24\x21\xf1\x24\x21\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x64\xc7\x39\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x45\x29\xff\x45\x29\x64\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x64\xc7\x39\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x45"
+    "\x29\xff\x45\x29\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x56\x45\x29\xe3\x65\x29\xdf\x65\x29\xe1\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7"
+    "\x45\x29\xe7\x24\x21\xe7\x24\x21\xe3\x24\x21\xe7\x24\x21\x56\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t bB = {
   .header.always_zero = 0,
@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_BK
-uint8_t bK_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xb4,0x45,0x29,0xe4,0x45,0x29,0xe4,0x45,0x29,0xb6,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xd5,0x28,0x42,0xff,0x28,0x42,0xff,0x45,0x29,0xd8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xc2,0x65,0x29,0xdb,0x65,0x29,0xf0,0x28,0x42,0xff,0x28,0x4a,0xff,0x45,0x29,0xf1,0x65,0x29,0xdb,0x45,0x29,0xc2,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xdf,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x45,0x29,0xdf,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xe0,0xe7,0x41,0xff,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xff,0xe7,0x41,0xff,0x45,0x29,0xe1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x77,0x45,0x29,0x98,0x45,0x29,0xf0,0x28,0x4a,0xff,0x28,0x4a,0xff,0x45,0x29,0xf0,0x45,0x29,0x98,0x45,0x29,0x77,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x4e,0x45,0x29,0xc4,0x45,0x29,0xe3,0x65,0x29,0xe4,0x65,0x29,0xe4,0x45,0x29,0xca,0x45,0x29,0x78,0x65,0x29,0xe7,0x28,0x4a,0xff,0x28,0x4a,0xff,0x65,0x29,0xe8,0x45,0x29,0x78,0x45,0x29,0xca,0x45,0x29,0xe6,0x24,0x21,0xe9,0x24,0x21,0xe7,0x24,0x21,0xca,0x45,0x29,0x50,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x04,0x45,0x29,0xb2,0x86,0x31,0xee,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0xc7,0x39,0xf8,0xc7,0x39,0xf8,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xf8,0xc7,0x39,0xf7,0x08,0x42,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0xa6,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xf3,0x45,0x29,0xb7,0x86,0x31,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x8f,0xa6,0x39,0xf5,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xf8,0x45,0x29,0x96,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x65,0x29,0xe8,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x08,0x42,0xff,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x08,0x42,0xff,0x28,0x42,0xff,0xe7,0x41,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xed,0x08,0x42,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x2a,0x86,0x31,0xe9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x07,0x42,0xfe,0x45,0x29,0xe6,0x65,0x29,0xb3,0x45,0x29,0xc9,0x65,0x29,0xe2,0x86,0x31,0xea,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xea,0x65,0x29,0xe2,0x45,0x29,0xc9,0x65,0x29,0xb3,0x45,0x29,0xe6,0xe7,0x39,0xfe,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xee,0x45,0x29,0x2c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x27,0x86,0x31,0xe8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xea,0x45,0x29,0x32,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0xae,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x65,0x29,0xae,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x36,0x86,0x31,0xec,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xee,0x45,0x29,0x2a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x07,0x65,0x29,0xe7,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xf2,0x45,0x29,0x67,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xd0,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x45,0x29,0xd0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x59,0x86,0x31,0xf4,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xeb,0x04,0x21,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0xa7,0xe7,0x39,0xfc,0x28,0x4a,0xff,0x28,0x42,0xff,0x65,0x29,0xea,0x65,0x29,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0xe4,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x65,0x29,0xe4,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x24,0x65,0x29,0xe4,0xa6,0x31,0xff,0x86,0x31,0xff,0x45,0x29,0xfe,0x24,0x21,0xaf,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x16,0x45,0x29,0xe6,0x08,0x42,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x65,0x31,0xeb,0x65,0x29,0xaa,0x45,0x29,0x50,0x65,0x29,0xe8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x65,0x29,0xe8,0x45,0x29,0x66,0x45,0x29,0xb4,0x65,0x29,0xe9,0xc7,0x39,0xff,0x86,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xea,0x65,0x29,0x17,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0x3a,0x65,0x29,0xeb,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0xa6,0x39,0xf2,0xe7,0x39,0xf9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xfa,0xc7,0x39,0xfb,0xe7,0x41,0xff,0x07,0x42,0xff,0x86,0x31,0xff,0x85,0x31,0xff,0x04,0x21,0xef,0x45,0x29,0x3d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x29,0x5c,0x65,0x29,0xed,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x85,0x31,0xff,0x24,0x21,0xf1,0x45,0x29,0x61,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x67,0x65,0x31,0xec,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x85,0x31,0xff,0x04,0x21,0xf1,0x45,0x29,0x73,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x56,0x45,0x29,0xec,0x65,0x29,0xfe,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x24,0x21,0xff,0x04,0x21,0xff,0x04,0x21,0xff,0x24,0x21,0xe9,0x45,0x29,0x33,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xa5,0x86,0x31,0xef,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x86,0x31,0xff,0x65,0x29,0xff,0x24,0x21,0xf0,0x65,0x29,0x69,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x59,0xa6,0x31,0xf0,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xed,0x24,0x21,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0x8b,0xe7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x29,0xf3,0x45,0x29,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0x8b,0xe7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x29,0xf3,0x45,0x29,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x74,0x45,0x29,0xe6,0x65,0x29,0xdb,0x65,0x29,0xdd,0x65,0x29,0xdf,0x65,0x29,0xe4,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x65,0x29,0xe4,0x65,0x29,0xdf,0x24,0x21,0xe2,0x24,0x21,0xe2,0x24,0x21,0xea,0x24,0x21,0x3b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t bK_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xb4\x45\x29\xe4\x45\x29\xe4\x45\x29"
+    "\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45"
+    "\x29\xd5\x28\x42\xff\x28\x42\xff\x45\x29\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x45\x29\xc2\x65\x29\xdb\x65\x29\xf0\x28\x42\xff\x28\x4a\xff\x45\x29\xf1\x65\x29\xdb\x45\x29\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xdf\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x45\x29\xdf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xe0\xe7\x41\xff\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\xe7\x39\xff\xe7\x41\xff\x45\x29\xe1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x77\x45\x29\x98\x45\x29\xf0\x28\x4a\xff\x28\x4a\xff\x45\x29\xf0\x45\x29\x98\x45\x29\x77\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x4e\x45\x29\xc4\x45\x29\xe3\x65\x29\xe4\x65\x29\xe4\x45\x29\xca\x45\x29\x78\x65\x29\xe7\x28\x4a\xff\x28\x4a\xff\x65\x29\xe8\x45\x29\x78\x45\x29\xca\x45\x29\xe6\x24\x21\xe9\x24\x21\xe7\x24\x21\xca\x45"
+    "\x29\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x04\x45\x29\xb2\x86\x31\xee\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\xc7\x39\xf8\xc7\x39\xf8\x28\x4a\xff\x28\x4a\xff\xc7\x39\xf8\xc7\x39\xf7\x08\x42\xff\x28\x4a\xff"
+    "\x08\x42\xff\xa6\x31\xff\x65\x31\xff\x24\x21\xf3\x45\x29\xb7\x86\x31\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x8f\xa6\x39\xf5\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x86\x31\xff\x86\x31\xff\x45\x29\xf8\x45\x29\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\x65\x29\xe8\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x08\x42\xff\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x08\x42\xff\x28\x42\xff\xe7\x41\xff\x86\x31\xff\x86\x31\xff\x24\x21\xed\x08\x42\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x2a\x86\x31\xe9\x28\x4a\xff\x28\x4a\xff\x07\x42\xfe\x45\x29\xe6\x65\x29\xb3"
+    "\x45\x29\xc9\x65\x29\xe2\x86\x31\xea\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xea\x65\x29\xe2\x45\x29\xc9\x65\x29\xb3\x45\x29\xe6\xe7\x39\xfe\x86\x31\xff\x86\x31\xff\x24\x21\xee\x45\x29\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x27\x86\x31\xe8\x28\x4a\xff\x28\x4a"
+    "\xff\x86\x31\xea\x45\x29\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\xae\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x65\x29\xae\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x36\x86\x31\xec\x86\x31\xff\x86\x31\xff\x24\x21\xee\x45\x29\x2a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24"
+    "\x21\x07\x65\x29\xe7\x28\x4a\xff\x28\x4a\xff\xa6\x39\xf2\x45\x29\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xd0\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x45\x29\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x59\x86\x31\xf4\x86\x31\xff\x86\x31\xff\x24\x21\xeb\x04\x21\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\xa7\xe7\x39\xfc\x28\x4a\xff\x28\x42\xff\x65\x29\xea\x65\x29\x40\x00\x00\x00\x00\x00\x00\x65\x29\xe4\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x65\x29\xe4\x00\x00\x00\x00\x00\x00\x45\x29\x24\x65\x29\xe4\xa6\x31\xff\x86\x31\xff\x45\x29\xfe\x24\x21\xaf\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x16\x45\x29\xe6\x08\x42\xff\x28\x4a\xff\x08\x42\xff\x65\x31\xeb\x65\x29\xaa\x45\x29\x50\x65\x29\xe8\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x65\x29\xe8\x45\x29\x66\x45\x29\xb4\x65\x29\xe9\xc7\x39\xff\x86\x31\xff\x65"
+    "\x31\xff\x24\x21\xea\x65\x29\x17\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\x3a\x65\x29\xeb\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\xa6\x39\xf2\xe7\x39\xf9\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xfa\xc7\x39\xfb\xe7\x41\xff"
+    "\x07\x42\xff\x86\x31\xff\x85\x31\xff\x04\x21\xef\x45\x29\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x29\x5c\x65\x29\xed\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x85\x31\xff\x24\x21\xf1\x45\x29\x61\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x67\x65\x31\xec\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x85\x31\xff\x04\x21\xf1\x45\x29\x73\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x56\x45\x29\xec\x65\x29\xfe"
+    "\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x24\x21\xff\x04\x21\xff\x04\x21\xff\x24\x21\xe9\x45\x29\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29"
+    "\xa5\x86\x31\xef\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x86\x31\xff\x65\x29\xff\x24\x21\xf0\x65\x29\x69\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x45\x29\x59\xa6\x31\xf0\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x86\x31\xff\x86\x31\xff\x24\x21\xed\x24\x21\x23\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\x8b\xe7\x39\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x86\x31\xff\x86\x31\xff\x24\x29\xf3\x45\x29\x44\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\x8b\xe7\x39\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x86\x31\xff\x86\x31\xff\x24"
+    "\x29\xf3\x45\x29\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x74\x45\x29\xe6\x65\x29\xdb\x65\x29\xdd\x65\x29\xdf\x65\x29\xe4\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x65\x29\xe4"
+    "\x65\x29\xdf\x24\x21\xe2\x24\x21\xe2\x24\x21\xea\x24\x21\x3b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t bK = {
   .header.always_zero = 0,
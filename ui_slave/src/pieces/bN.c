@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_BN
-uint8_t bN_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x65,0x29,0x1d,0x24,0x21,0xdc,0x24,0x21,0xe0,0x45,0x29,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x6c,0xa6,0x39,0xfa,0x65,0x29,0xfe,0x24,0x21,0xdf,0x04,0x21,0x0f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xc5,0x08,0x42,0xff,0xe7,0x41,0xff,0x45,0x29,0xfb,0x24,0x21,0xe5,0x45,0x29,0xa1,0x65,0x29,0x52,0x65,0x29,0x0b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x6c,0x86,0x31,0xed,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0xe7,0x39,0xff,0x86,0x31,0xff,0x24,0x29,0xf6,0x24,0x21,0xed,0x45,0x29,0xab,0x24,0x21,0x1b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5e,0x65,0x29,0xed,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0xe7,0x39,0xff,0x45,0x29,0xfe,0x24,0x21,0xed,0x45,0x29,0x62,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x15,0x65,0x29,0xe7,0x28,0x42,0xff,0x28,0x42,0xff,0xa6,0x31,0xec,0xe7,0x41,0xf8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x24,0x21,0xf2,0x45,0x29,0x6c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x79,0xc7,0x39,0xfb,0x28,0x4a,0xff,0x86,0x31,0xee,0x45,0x29,0x98,0x86,0x31,0xea,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x85,0x31,0xff,0x04,0x21,0xef,0x24,0x21,0x29,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x45,0x29,0xdf,0x28,0x42,0xff,0x08,0x42,0xff,0x45,0x29,0xf6,0x65,0x29,0xe4,0xc6,0x39,0xf3,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x31,0xff,0x65,0x29,0xff,0x45,0x29,0xc4,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5c,0xa6,0x31,0xf1,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xff,0x86,0x31,0xff,0x04,0x21,0xec,0x65,0x29,0x0b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x19,0x45,0x29,0xe6,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xfe,0x07,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xff,0x86,0x31,0xff,0x24,0x21,0xf2,0x45,0x29,0x3d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x0d,0x45,0x29,0xd8,0xe7,0x41,0xfd,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xfe,0x45,0x29,0xfb,0x07,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x86,0x31,0xff,0x45,0x29,0xfe,0x45,0x29,0x75,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x49,0xa6,0x39,0xf3,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0xa6,0x31,0xf3,0x45,0x29,0xda,0x45,0x29,0xee,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xff,0x86,0x31,0xff,0x45,0x29,0xff,0x45,0x29,0x83,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x4e,0xa6,0x39,0xf4,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x65,0x29,0xea,0x45,0x29,0xb0,0x45,0x29,0x5a,0x45,0x29,0x88,0xa6,0x39,0xf2,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xff,0x86,0x31,0xff,0x45,0x29,0xff,0x45,0x29,0x86,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x13,0x45,0x29,0xe4,0xe7,0x39,0xfd,0x28,0x4a,0xff,0x08,0x42,0xff,0x45,0x29,0xe7,0x24,0x21,0x29,0x00,0x00,0x00,0x45,0x29,0x5a,0x65,0x29,0xed,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xff,0x86,0x31,0xff,0x45,0x29,0xfe,0x45,0x29,0x72,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x16,0x45,0x29,0xa6,0x65,0x29,0xe8,0x65,0x29,0xe9,0x45,0x29,0x39,0x00,0x00,0x00,0x45,0x29,0x3e,0x65,0x29,0xeb,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x29,0xf5,0x24,0x21,0x48,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe3,0x18,0x09,0x45,0x29,0x12,0x00,0x00,0x00,0x45,0x29,0x26,0x65,0x29,0xe8,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xed,0x24,0x21,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x65,0x29,0xd3,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xea,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x3c,0x86,0x31,0xee,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc6,0x39,0xff,0x86,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xc9,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x64,0x45,0x29,0xe7,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x65,0x29,0xff,0x24,0x21,0xff,0x04,0x21,0xff,0x04,0x21,0xff,0x04,0x21,0xe7,0x45,0x29,0x47,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x45,0x29,0xb4,0x86,0x31,0xf1,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xf1,0x45,0x29,0x8a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x6b,0xa6,0x31,0xf2,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xf0,0x45,0x29,0x38,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x9b,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x44,0x29,0xfc,0x45,0x29,0x5d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x9b,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x44,0x29,0xfc,0x45,0x29,0x5d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x81,0x45,0x29,0xe6,0x45,0x29,0xe4,0x65,0x29,0xdc,0x65,0x29,0xdc,0x65,0x29,0xdf,0x65,0x29,0xe3,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x65,0x29,0xe3,0x65,0x29,0xdf,0x65,0x29,0xdb,0x24,0x21,0xe2,0x24,0x21,0xe8,0x24,0x21,0xea,0x45,0x29,0x50,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t bN_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x65\x29\x1d\x24\x21\xdc\x24\x21\xe0\x45\x29\x18\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x6c\xa6\x39\xfa\x65\x29\xfe\x24"
+    "\x21\xdf\x04\x21\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x45\x29\xc5\x08\x42\xff\xe7\x41\xff\x45\x29\xfb\x24\x21\xe5\x45\x29\xa1\x65\x29\x52\x65\x29\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x45\x29\x6c\x86\x31\xed\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\xe7\x39\xff\x86\x31\xff\x24\x29\xf6\x24\x21\xed\x45\x29\xab\x24\x21\x1b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5e\x65\x29\xed\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\xe7\x39\xff\x45\x29\xfe\x24\x21\xed\x45\x29\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x15\x65\x29\xe7\x28\x42\xff\x28\x42\xff\xa6\x31\xec\xe7\x41\xf8\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x24\x21\xf2\x45\x29\x6c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x79\xc7\x39\xfb\x28\x4a\xff\x86\x31\xee\x45\x29\x98\x86\x31\xea\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x85\x31\xff\x04\x21\xef\x24\x21\x29\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x45\x29\xdf\x28\x42\xff\x08\x42\xff\x45\x29\xf6\x65\x29\xe4\xc6\x39\xf3\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff"
+    "\xa6\x31\xff\x65\x29\xff\x45\x29\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5c\xa6\x31\xf1\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xff\x86\x31\xff\x04\x21\xec\x65\x29\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x19\x45\x29\xe6\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\xe7\x39\xfe\x07\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x39\xff\x86\x31\xff\x24\x21\xf2\x45\x29\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x0d\x45\x29\xd8\xe7\x41\xfd\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff"
+    "\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xfe\x45\x29\xfb\x07\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x86\x31\xff\x45\x29\xfe\x45\x29\x75\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x49\xa6\x39\xf3\x28\x4a"
+    "\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\xa6\x31\xf3\x45\x29\xda\x45\x29\xee\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x39\xff\x86\x31\xff\x45\x29\xff\x45\x29\x83\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x24\x21\x4e\xa6\x39\xf4\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x65\x29\xea\x45\x29\xb0\x45\x29\x5a\x45\x29\x88\xa6\x39\xf2\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xff\x86\x31\xff\x45\x29\xff\x45\x29\x86\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x13\x45\x29\xe4\xe7\x39\xfd\x28\x4a\xff\x08\x42\xff\x45\x29\xe7\x24\x21\x29\x00\x00\x00\x45\x29\x5a\x65\x29\xed\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xff\x86\x31\xff\x45\x29\xfe\x45\x29\x72\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x16\x45\x29\xa6\x65\x29\xe8\x65\x29\xe9\x45\x29\x39\x00\x00\x00\x45\x29\x3e\x65\x29\xeb\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x24\x29\xf5\x24"
+    "\x21\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe3\x18\x09\x45\x29\x12\x00\x00\x00\x45\x29\x26\x65\x29\xe8\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff"
+    "\x86\x31\xff\x86\x31\xff\x24\x21\xed\x24\x21\x23\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x65\x29\xd3\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\x86\x31\xff\x86\x31\xff\x24\x21\xea\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x3c\x86\x31\xee\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc6\x39\xff\x86\x31\xff\x65\x31\xff\x24\x21\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x64\x45\x29\xe7"
+    "\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x65\x29\xff\x24\x21\xff\x04\x21\xff\x04\x21\xff\x04\x21\xe7\x45\x29\x47\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x01\x45\x29\xb4\x86\x31\xf1\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x65\x31\xff\x24\x21\xf1\x45\x29\x8a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x6b\xa6\x31\xf2\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x86\x31\xff\x24\x21\xf0\x45\x29\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x9b\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x44\x29\xfc\x45\x29\x5d\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x9b\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86"
+    "\x31\xff\x44\x29\xfc\x45\x29\x5d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x81\x45\x29\xe6\x45\x29\xe4\x65\x29\xdc\x65\x29\xdc\x65\x29\xdf\x65\x29\xe3\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x65\x29\xe3"
+    "\x65\x29\xdf\x65\x29\xdb\x24\x21\xe2\x24\x21\xe8\x24\x21\xea\x45\x29\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t bN = {
   .header.always_zero = 0,
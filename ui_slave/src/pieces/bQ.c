@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_BQ
-uint8_t bQ_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x16,0x65,0x29,0xaa,0x45,0x29,0xdc,0x65,0x29,0xba,0x24,0x21,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x24,0x65,0x29,0xba,0x45,0x29,0xdc,0x65,0x29,0xa9,0x04,0x21,0x16,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x06,0x45,0x29,0xd9,0xe7,0x39,0xfd,0x28,0x4a,0xff,0x07,0x42,0xff,0x65,0x29,0xe3,0x24,0x21,0x0d,0x24,0x21,0x0e,0x65,0x29,0xe4,0x07,0x42,0xff,0x28,0x4a,0xff,0xe7,0x39,0xfd,0x45,0x29,0xd9,0x86,0x31,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x3d,0x86,0x31,0xee,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xf8,0x45,0x29,0x5c,0x45,0x29,0x5e,0xc7,0x39,0xf8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x31,0xed,0x24,0x21,0x3c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x44,0xa6,0x31,0xf0,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xf9,0x45,0x29,0x5f,0x45,0x29,0x62,0xc6,0x39,0xf9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x31,0xef,0x45,0x29,0x43,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x25,0x45,0x29,0x69,0x24,0x21,0x4f,0x86,0x31,0x05,0x24,0x21,0x07,0x45,0x29,0xdf,0xe7,0x41,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x45,0x29,0xe6,0x86,0x31,0x10,0x65,0x29,0x11,0x45,0x29,0xe6,0x08,0x42,0xff,0x28,0x4a,0xff,0xe7,0x41,0xfe,0x45,0x29,0xde,0x45,0x29,0x06,0x86,0x31,0x05,0x24,0x21,0x4f,0x45,0x29,0x69,0x45,0x29,0x24,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5f,0x65,0x29,0xea,0xc7,0x39,0xfd,0xa6,0x31,0xf3,0x45,0x29,0xd4,0xe3,0x18,0x09,0x45,0x29,0x1e,0x45,0x29,0xd6,0xe7,0x39,0xff,0xe7,0x41,0xff,0x45,0x29,0xb9,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xb9,0xe7,0x41,0xff,0xe7,0x39,0xff,0x45,0x29,0xd5,0x65,0x29,0x1d,0x86,0x31,0x0a,0x45,0x29,0xd4,0xa6,0x31,0xf4,0xc7,0x39,0xfd,0x65,0x29,0xea,0x45,0x29,0x5c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x45,0x29,0xe7,0x28,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xf8,0x65,0x29,0x7a,0x00,0x00,0x00,0x45,0x29,0x88,0xe7,0x39,0xff,0x28,0x4a,0xff,0x65,0x29,0xea,0x45,0x29,0x25,0x45,0x29,0x25,0x65,0x29,0xea,0x28,0x4a,0xff,0xe7,0x39,0xff,0x45,0x29,0x88,0x00,0x00,0x00,0x45,0x29,0x7d,0xc7,0x39,0xf9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x45,0x29,0xe6,0x00,0x00,0x02,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x14,0x65,0x29,0xe7,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x07,0x42,0xff,0x45,0x29,0xb1,0x00,0x00,0x00,0x45,0x29,0x88,0xe7,0x39,0xff,0x28,0x4a,0xff,0xe7,0x41,0xfe,0x45,0x29,0xb2,0x45,0x29,0xb2,0xe7,0x41,0xfe,0x28,0x4a,0xff,0xe7,0x39,0xff,0x45,0x29,0x88,0x00,0x00,0x00,0x45,0x29,0xb1,0x07,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x65,0x29,0xe7,0x24,0x21,0x14,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xde,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xa6,0x39,0xfa,0x45,0x29,0x9c,0x00,0x00,0x02,0x45,0x29,0x88,0xe7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x65,0x29,0xea,0x65,0x29,0xea,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xff,0x45,0x29,0x88,0x00,0x00,0x02,0x45,0x29,0x9d,0xa6,0x39,0xfa,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x45,0x29,0xde,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x24,0x21,0x36,0x65,0x29,0xe3,0x86,0x31,0xec,0xe7,0x39,0xfb,0x08,0x42,0xff,0xa6,0x31,0xf0,0x45,0x29,0xde,0x45,0x29,0xc2,0xe7,0x39,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xfe,0xe7,0x41,0xfe,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x39,0xff,0x45,0x29,0xc2,0x45,0x29,0xdf,0xa6,0x31,0xf0,0x08,0x42,0xff,0xe7,0x39,0xfb,0x86,0x31,0xec,0x65,0x29,0xe3,0x24,0x21,0x36,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x21,0x08,0x45,0x29,0x3a,0x65,0x29,0xe9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0xa6,0x31,0xf5,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xe7,0x41,0xff,0xa6,0x31,0xf5,0x08,0x42,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x24,0x21,0xec,0x45,0x29,0x3a,0x24,0x21,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xb8,0xe7,0x41,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x85,0x31,0xff,0x24,0x29,0xbc,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x3f,0x86,0x31,0xec,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xff,0x24,0x21,0xf1,0x45,0x29,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xe0,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x07,0x42,0xff,0x85,0x31,0xff,0x24,0x21,0xe5,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x7d,0xc7,0x39,0xf9,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0x86,0x31,0xff,0x45,0x29,0xfb,0x45,0x29,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x13,0x65,0x29,0xe8,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0xc7,0x39,0xff,0x86,0x31,0xff,0x24,0x21,0xed,0x24,0x21,0x15,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0xbd,0x07,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x65,0x29,0xff,0x45,0x29,0xc1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x43,0x86,0x31,0xed,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x42,0xff,0xa6,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xf2,0x24,0x21,0x43,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x43,0x45,0x29,0xd7,0x65,0x29,0xfb,0x65,0x29,0xfc,0x65,0x29,0xfc,0x65,0x29,0xfc,0x65,0x29,0xfc,0x65,0x29,0xfc,0x65,0x29,0xfc,0x65,0x29,0xfc,0x45,0x29,0xfc,0x04,0x21,0xfd,0xe3,0x18,0xfd,0x04,0x21,0xfc,0x24,0x21,0xdb,0x65,0x29,0x45,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x87,0x65,0x31,0xed,0x08,0x42,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x65,0x31,0xff,0x24,0x21,0xf1,0x45,0x29,0x8a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x39,0x85,0x31,0xed,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x08,0x42,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x24,0x21,0xf0,0x45,0x29,0x39,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5f,0xc7,0x39,0xfc,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x44,0x29,0xfd,0x45,0x29,0x5f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x5f,0xc7,0x39,0xfc,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x28,0x4a,0xff,0x86,0x31,0xff,0x86,0x31,0xff,0x44,0x29,0xfd,0x45,0x29,0x5f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x52,0x45,0x29,0xe7,0x45,0x29,0xe4,0x65,0x29,0xde,0x65,0x29,0xdb,0x65,0x29,0xdf,0x65,0x29,0xe2,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x45,0x29,0xe7,0x65,0x29,0xe3,0x65,0x29,0xdf,0x65,0x29,0xdb,0x24,0x21,0xe2,0x24,0x21,0xe8,0x24,0x21,0xea,0x45,0x29,0x52,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t bQ_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x16\x65\x29\xaa\x45\x29\xdc\x65\x29\xba\x24\x21\x23\x00\x00\x00\x00\x00\x00\x45\x29"
+    "\x24\x65\x29\xba\x45\x29\xdc\x65\x29\xa9\x04\x21\x16\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x06\x45\x29\xd9\xe7\x39\xfd\x28\x4a\xff\x07\x42\xff\x65"
+    "\x29\xe3\x24\x21\x0d\x24\x21\x0e\x65\x29\xe4\x07\x42\xff\x28\x4a\xff\xe7\x39\xfd\x45\x29\xd9\x86\x31\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x3d\x86\x31\xee"
+    "\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xf8\x45\x29\x5c\x45\x29\x5e\xc7\x39\xf8\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x31\xed\x24\x21\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x45\x29\x44\xa6\x31\xf0\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xf9\x45\x29\x5f\x45\x29\x62\xc6\x39\xf9\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xa6\x31\xef\x45\x29\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x45\x29\x25\x45\x29\x69\x24\x21\x4f\x86\x31\x05\x24\x21\x07\x45\x29\xdf\xe7\x41\xff\x28\x4a\xff\x08\x42\xff\x45\x29\xe6\x86\x31\x10\x65\x29\x11\x45\x29\xe6\x08\x42\xff\x28\x4a\xff\xe7\x41\xfe\x45\x29\xde\x45\x29\x06\x86\x31\x05\x24\x21\x4f\x45\x29\x69\x45\x29\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5f\x65\x29\xea\xc7\x39\xfd\xa6\x31\xf3\x45\x29\xd4\xe3\x18\x09\x45\x29\x1e\x45\x29\xd6\xe7\x39\xff\xe7\x41\xff\x45\x29\xb9\x00\x00\x00\x00\x00\x00\x45\x29\xb9\xe7\x41\xff\xe7\x39\xff\x45\x29\xd5\x65\x29\x1d\x86\x31\x0a\x45\x29\xd4\xa6\x31\xf4\xc7\x39\xfd\x65\x29\xea\x45\x29"
+    "\x5c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x45\x29\xe7\x28\x42\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xf8\x65\x29\x7a\x00\x00\x00\x45\x29\x88\xe7\x39\xff\x28\x4a\xff\x65\x29\xea\x45\x29\x25\x45\x29\x25\x65\x29\xea\x28\x4a\xff\xe7\x39\xff\x45\x29\x88\x00\x00\x00\x45\x29\x7d\xc7\x39\xf9\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x42\xff\x45\x29\xe6\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x14\x65\x29\xe7\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x07\x42\xff\x45\x29\xb1\x00\x00\x00\x45\x29\x88\xe7\x39\xff\x28\x4a\xff\xe7\x41\xfe\x45\x29\xb2\x45\x29\xb2\xe7\x41\xfe\x28\x4a\xff\xe7\x39\xff\x45\x29\x88"
+    "\x00\x00\x00\x45\x29\xb1\x07\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x65\x29\xe7\x24\x21\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xde\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\xa6\x39\xfa\x45\x29\x9c\x00\x00\x02\x45\x29\x88\xe7\x39\xff\x28\x4a\xff\x28\x4a\xff\x65\x29\xea\x65\x29\xea\x28\x4a"
+    "\xff\x28\x4a\xff\xe7\x39\xff\x45\x29\x88\x00\x00\x02\x45\x29\x9d\xa6\x39\xfa\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x45\x29\xde\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x24\x21\x36\x65\x29\xe3\x86\x31\xec\xe7\x39\xfb\x08\x42\xff\xa6\x31\xf0\x45\x29\xde\x45\x29\xc2\xe7\x39\xff\x28\x4a\xff\x28"
+    "\x4a\xff\xe7\x41\xfe\xe7\x41\xfe\x28\x4a\xff\x28\x4a\xff\xe7\x39\xff\x45\x29\xc2\x45\x29\xdf\xa6\x31\xf0\x08\x42\xff\xe7\x39\xfb\x86\x31\xec\x65\x29\xe3\x24\x21\x36\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x21\x08\x45\x29\x3a\x65\x29\xe9\x28\x4a\xff\x28\x4a\xff\x08\x42\xff"
+    "\xa6\x31\xf5\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xe7\x41\xff\xa6\x31\xf5\x08\x42\xff\x28\x4a\xff\x08\x42\xff\x24\x21\xec\x45\x29\x3a\x24\x21\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29"
+    "\xb8\xe7\x41\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x85\x31\xff\x24\x29\xbc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x3f\x86\x31\xec\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xff\x24\x21\xf1\x45\x29\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xe0\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x07\x42\xff\x85\x31\xff\x24\x21\xe5\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x7d\xc7\x39\xf9\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\x86\x31\xff\x45\x29\xfb\x45\x29\x7f\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x13\x65\x29\xe8\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\xc7\x39\xff"
+    "\x86\x31\xff\x24\x21\xed\x24\x21\x15\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\xbd\x07\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a"
+    "\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x65\x29\xff\x45\x29\xc1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x43\x86\x31\xed\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28"
+    "\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x42\xff\xa6\x31\xff\x86\x31\xff\x24\x21\xf2\x24\x21\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x43\x45\x29\xd7\x65\x29\xfb"
+    "\x65\x29\xfc\x65\x29\xfc\x65\x29\xfc\x65\x29\xfc\x65\x29\xfc\x65\x29\xfc\x65\x29\xfc\x45\x29\xfc\x04\x21\xfd\xe3\x18\xfd\x04\x21\xfc\x24\x21\xdb\x65\x29\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29"
+    "\x87\x65\x31\xed\x08\x42\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x65\x31\xff\x24\x21\xf1\x45\x29\x8a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x45\x29\x39\x85\x31\xed\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x08\x42\xff\x86\x31\xff\x86\x31\xff\x24\x21\xf0\x45\x29\x39\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5f\xc7\x39\xfc\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x44\x29\xfd\x45\x29\x5f\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x5f\xc7\x39\xfc\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x28\x4a\xff\x86\x31\xff\x86\x31\xff\x44"
+    "\x29\xfd\x45\x29\x5f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x52\x45\x29\xe7\x45\x29\xe4\x65\x29\xde\x65\x29\xdb\x65\x29\xdf\x65\x29\xe2\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x45\x29\xe7\x65\x29\xe3\x65\x29\xdf"
+    "\x65\x29\xdb\x24\x21\xe2\x24\x21\xe8\x24\x21\xea\x45\x29\x52\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t bQ = {
   .header.always_zero = 0,
@@ -1,11 +1,30 @@
 #!/usr/bin/env python3
-"""Convert PNG chess piece images to LVGL v8 C arrays (LV_IMG_CF_TRUE_COLOR_ALPHA)."""
+"""Convert PNG chess piece images to LVGL v8 C arrays (LV_IMG_CF_TRUE_COLOR_ALPHA).
 
-import os, sys
+--mode selects how the pixel data is embedded:
+  literal  hex-escaped string literal in the .c file (default, any compiler)
+  embed    C23 #embed of {name}_map.bin (GCC 15 / clang 19+)
+  incbin   assembler .incbin of {name}_map.bin; the assembler finds the .bin
+           files through -Wa,-Isrc/pieces (set in platformio.ini and the
+           simulator's CMakeLists.txt). The map is placed in its own 4-byte
+           aligned .rodata.{name}_map section; LV_ATTRIBUTE_LARGE_CONST and
+           LV_ATTRIBUTE_{NAME} cannot be applied to it.
+Switching back to literal removes the {name}_map.bin files again.
+"""
+
+import argparse, os, sys
 from PIL import Image
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # falls back to the per-pixel loop
+
 PIECES_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Hex escapes per source line of the emitted string literal
+BYTES_PER_LINE = 80
+
 TEMPLATE = """/*
  * Auto-generated LVGL v8 image: {name}
  * Source: {filename}
@@ -25,11 +44,7 @@ TEMPLATE = """/*
 #define LV_ATTRIBUTE_{NAME}
 #endif
 
-static const
-LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_{NAME}
-uint8_t {name}_map[] = {{
-{data}
-}};
+{map_def}
 
 const lv_img_dsc_t {name} = {{
   .header.always_zero = 0,
@@ -41,10 +56,49 @@ const lv_img_dsc_t {name} = {{
 }};
 """
 
-def png_to_lvgl_v8(png_path, out_path, name):
+# {name}_map definitions per --mode
+MAP_LITERAL = """static const
+LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_{NAME}
+uint8_t {name}_map[] =
+{data};"""
+
+MAP_EMBED = """static const
+LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_{NAME}
+uint8_t {name}_map[] = {{
+#embed "{name}_map.bin"
+}};"""
+
+MAP_INCBIN = """/* LV_ATTRIBUTE_* placement attributes don't apply to assembler data */
+__asm__(".section .rodata.{name}_map, \\"a\\"\\n"
+        ".balign 4\\n"
+        "{name}_map:\\n"
+        ".incbin \\"{name}_map.bin\\"\\n"
+        ".previous\\n");
+extern const uint8_t {name}_map[];"""
+
+MODES = {'literal': MAP_LITERAL, 'embed': MAP_EMBED, 'incbin': MAP_INCBIN}
+
+def write_if_changed(path, content):
+    """Leave identical outputs untouched so the firmware build doesn't recompile them."""
+    binary = 'b' if isinstance(content, bytes) else ''
+    if os.path.exists(path):
+        with open(path, 'r' + binary) as f:
+            if f.read() == content:
+                return
+    with open(path, 'w' + binary) as f:
+        f.write(content)
+
+def rgb565a_numpy(img):
+    """Vectorized RGBA -> RGB565 LE + alpha, same layout as the Python loop."""
+    arr = np.asarray(img, dtype=np.uint8)
+    r, g, b, a = (arr[..., i].astype(np.uint16) for i in range(4))
+    rgb565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    out = np.stack([rgb565 & 0xFF, rgb565 >> 8, a], axis=-1).astype(np.uint8)
+    return out.tobytes()
+
+def png_to_lvgl_v8(png_path, out_path, name, mode='literal'):
     img = Image.open(png_path).convert("RGBA")
     w, h = img.size
-    pixels = list(img.getdata())
     
     # LVGL v8 TRUE_COLOR_ALPHA: each pixel = B, G, R, A (4 bytes, little-endian RGB565... 
     # Actually for LV_IMG_CF_TRUE_COLOR_ALPHA with LV_COLOR_DEPTH=16:
@@ -53,54 +107,78 @@ def png_to_lvgl_v8(png_path, out_path, name):
     # ESP32 with TFT_eSPI typically uses 16-bit color.
     # Let's use LV_COLOR_DEPTH 16 (RGB565) + alpha = 3 bytes/pixel
     
-    lines = []
-    row_bytes = []
-    for i, (r, g, b, a) in enumerate(pixels):
-        # Convert to RGB565 little-endian
-        r5 = (r >> 3) & 0x1F
-        g6 = (g >> 2) & 0x3F
-        b5 = (b >> 3) & 0x1F
-        rgb565 = (r5 << 11) | (g6 << 5) | b5
-        lo = rgb565 & 0xFF
-        hi = (rgb565 >> 8) & 0xFF
-        row_bytes.extend([lo, hi, a])
-        
-        if (i + 1) % w == 0:
-            hex_str = ','.join(f'0x{b:02x}' for b in row_bytes)
-            lines.append(f'    {hex_str},')
-            row_bytes = []
+    if np is not None:
+        data = rgb565a_numpy(img)
+    else:
+        # Preallocated output, filled in place instead of growing a list
+        data = bytearray(w * h * 3)
+        off = 0
+        for r, g, b, a in img.getdata():
+            # Convert to RGB565 little-endian
+            r5 = (r >> 3) & 0x1F
+            g6 = (g >> 2) & 0x3F
+            b5 = (b >> 3) & 0x1F
+            rgb565 = (r5 << 11) | (g6 << 5) | b5
+            data[off] = rgb565 & 0xFF
+            data[off + 1] = (rgb565 >> 8) & 0xFF
+            data[off + 2] = a
+            off += 3
+    
+    data_str = ''
+    bin_path = os.path.join(os.path.dirname(out_path), f"{name}_map.bin")
+    if mode == 'literal':
+        # Emit a string literal instead of a {0x..,} initializer list: far fewer
+        # tokens for the compiler. The trailing NUL is ignored via data_size.
+        # bytes.hex() does the per-byte formatting in C; the separator is then
+        # widened into the \x escape prefix.
+        lines = []
+        for off in range(0, len(data), BYTES_PER_LINE):
+            chunk = data[off:off + BYTES_PER_LINE].hex(' ').replace(' ', '\\x')
+            lines.append(f'    "\\x{chunk}"')
+        data_str = '\n'.join(lines)
+        # Left over from an embed/incbin run
+        if os.path.exists(bin_path):
+            os.remove(bin_path)
+    else:
+        # The compiler/assembler pulls the raw bytes in without parsing them
+        write_if_changed(bin_path, bytes(data))
     
     data_size = w * h * 3  # 3 bytes per pixel (RGB565 + alpha)
-    data_str = '\n'.join(lines)
     
+    map_def = MODES[mode].format(name=name, NAME=name.upper(), data=data_str)
     c_code = TEMPLATE.format(
         name=name, NAME=name.upper(), filename=os.path.basename(png_path),
-        w=w, h=h, data=data_str, data_size=data_size
+        w=w, h=h, map_def=map_def, data_size=data_size
     )
     
-    with open(out_path, 'w') as f:
-        f.write(c_code)
-    print(f"  {name}: {w}x{h}, {data_size} bytes -> {out_path}")
+    write_if_changed(out_path, c_code)
+    return f"  {name}: {w}x{h}, {data_size} bytes -> {out_path}"
+
+def _convert_one(name, mode):
+    png = os.path.join(PIECES_DIR, f"{name}.png")
+    out = os.path.join(PIECES_DIR, f"{name}.c")
+    if not os.path.exists(png):
+        return f"  SKIP {name}: {png} not found"
+    return png_to_lvgl_v8(png, out, name, mode)
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', choices=MODES, default='literal',
+                        help="how pixel data is embedded (default: literal)")
+    args = parser.parse_args()
+
     piece_names = ['wK','wQ','wR','wB','wN','wP','bK','bQ','bR','bB','bN','bP']
-    print(f"Converting {len(piece_names)} pieces to LVGL v8 C arrays...")
+    print(f"Converting {len(piece_names)} pieces to LVGL v8 C arrays ({args.mode})...")
     for name in piece_names:
-        png = os.path.join(PIECES_DIR, f"{name}.png")
-        out = os.path.join(PIECES_DIR, f"{name}.c")
-        if not os.path.exists(png):
-            print(f"  SKIP {name}: {png} not found")
-            continue
-        png_to_lvgl_v8(png, out, name)
+        print(_convert_one(name, args.mode))
     
     # Generate header file
     header = os.path.join(PIECES_DIR, "pieces.h")
-    with open(header, 'w') as f:
-        f.write("#pragma once\n")
-        f.write("#ifdef LV_LVGL_H_INCLUDE_SIMPLE\n#include \"lvgl.h\"\n")
-        f.write("#else\n#include \"lvgl/lvgl.h\"\n#endif\n\n")
-        for name in piece_names:
-            f.write(f"extern const lv_img_dsc_t {name};\n")
+    h_code = ("#pragma once\n"
+              "#ifdef LV_LVGL_H_INCLUDE_SIMPLE\n#include \"lvgl.h\"\n"
+              "#else\n#include \"lvgl/lvgl.h\"\n#endif\n\n")
+    h_code += ''.join(f"extern const lv_img_dsc_t {name};\n" for name in piece_names)
+    write_if_changed(header, h_code)
     print(f"Header -> {header}")
     print("Done!")
 
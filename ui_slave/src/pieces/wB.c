@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_WB
-uint8_t wB_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x53,0x69,0x4a,0xd9,0x8a,0x52,0xe2,0x69,0x4a,0x67,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x29,0xeb,0x5a,0xeb,0x1c,0xe7,0xff,0x9a,0xd6,0xff,0x8a,0x52,0xb6,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x68,0x55,0xad,0xfe,0x5d,0xef,0xff,0x18,0xc6,0xff,0x69,0x4a,0x9b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x4d,0x51,0x8c,0xf2,0x5d,0xef,0xff,0xd3,0x9c,0xf8,0x08,0x42,0x5e,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x7d,0xae,0x73,0xf0,0x5d,0xef,0xff,0x4d,0x6b,0xe8,0xe7,0x39,0x21,0xc7,0x39,0x35,0xa6,0x31,0x17,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x49,0x4a,0x91,0xae,0x73,0xee,0x5d,0xef,0xff,0x3c,0xe7,0xff,0x69,0x4a,0xe0,0x00,0x00,0x00,0x28,0x42,0xcb,0x28,0x42,0xe5,0x08,0x42,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x8d,0x30,0x84,0xf2,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xfe,0x69,0x4a,0x92,0x08,0x42,0x18,0x49,0x4a,0xed,0x92,0x94,0xff,0x08,0x42,0xe8,0xc7,0x39,0x1a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x5a,0x6d,0x6b,0xee,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xae,0x73,0xea,0xe7,0x39,0x33,0x49,0x4a,0x75,0x30,0x84,0xfc,0x34,0xa5,0xff,0x51,0x8c,0xfe,0x28,0x42,0xd3,0x08,0x42,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x16,0x8a,0x52,0xe9,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x69,0x4a,0xe4,0x00,0x00,0x01,0x69,0x4a,0xce,0xba,0xd6,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0x4d,0x6b,0xf7,0x28,0x42,0x77,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xa5,0xb6,0xb5,0xfc,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x79,0xce,0xff,0x8a,0x52,0xb6,0x45,0x29,0x06,0xaa,0x52,0xe8,0x5d,0xef,0xff,0x59,0xce,0xff,0x34,0xa5,0xff,0x14,0xa5,0xff,0x08,0x42,0xe9,0x49,0x4a,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x08,0xaa,0x52,0xe8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x34,0xa5,0xfc,0x08,0x42,0x6c,0xc7,0x39,0x38,0xef,0x7b,0xec,0x5d,0xef,0xff,0x3c,0xe7,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x0c,0x63,0xf4,0xc7,0x39,0x46,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x43,0x30,0x84,0xef,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xd3,0x9c,0xf4,0xe7,0x39,0x4f,0x49,0x4a,0x79,0x75,0xad,0xfd,0x5d,0xef,0xff,0x5d,0xef,0xff,0x96,0xb5,0xff,0x34,0xa5,0xff,0x10,0x84,0xff,0x49,0x4a,0x96,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x5e,0x14,0xa5,0xfc,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xd3,0x9c,0xf6,0x49,0x4a,0xe9,0x49,0x4a,0xf2,0xba,0xd6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xd7,0xbd,0xff,0x34,0xa5,0xff,0x92,0x94,0xff,0x49,0x4a,0xb5,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x5a,0xf3,0x9c,0xf9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x34,0xa5,0xff,0x71,0x8c,0xff,0x49,0x4a,0xb0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x27,0x6d,0x6b,0xe9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0xae,0x73,0xfb,0x28,0x42,0x6c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xdf,0xfb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x49,0x4a,0xed,0x08,0x42,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x5c,0x30,0x84,0xf1,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x34,0xa5,0xff,0xef,0x7b,0xfd,0x49,0x4a,0xad,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x69,0x4a,0xc8,0x18,0xc6,0xfd,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x59,0xce,0xff,0x34,0xa5,0xff,0x71,0x8c,0xff,0x28,0x42,0xe4,0x08,0x42,0x14,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x47,0x69,0x4a,0xd8,0x69,0x4a,0xea,0xaa,0x52,0xfa,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0x8a,0x52,0xff,0x69,0x4a,0xff,0xe7,0x39,0xfb,0x08,0x42,0xea,0x28,0x42,0xd8,0x08,0x42,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x8a,0x6d,0x6b,0xed,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x75,0xad,0xff,0xd3,0x9c,0xff,0x8a,0x52,0xf1,0x49,0x4a,0x8b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x3c,0x6d,0x6b,0xed,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x8a,0x52,0xf1,0xe7,0x39,0x3c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x64,0x34,0xa5,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0xae,0x73,0xff,0xe7,0x39,0x64,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x64,0x34,0xa5,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0xae,0x73,0xff,0xe7,0x39,0x64,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x56,0x8a,0x52,0xe3,0xcb,0x5a,0xdf,0xaa,0x52,0xe1,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x49,0x4a,0xe7,0x49,0x4a,0xe3,0x28,0x42,0xe7,0xc7,0x39,0x56,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t wB_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x53\x69\x4a\xd9\x8a\x52\xe2\x69\x4a"
+    "\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x29\xeb"
+    "\x5a\xeb\x1c\xe7\xff\x9a\xd6\xff\x8a\x52\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x08\x42\x68\x55\xad\xfe\x5d\xef\xff\x18\xc6\xff\x69\x4a\x9b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x4d\x51\x8c\xf2\x5d\xef\xff\xd3\x9c\xf8\x08\x42\x5e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x7d\xae\x73\xf0\x5d\xef\xff\x4d\x6b\xe8\xe7\x39\x21\xc7\x39\x35\xa6\x31\x17\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x49\x4a\x91\xae\x73\xee\x5d\xef\xff\x3c\xe7\xff\x69\x4a\xe0\x00\x00\x00\x28\x42\xcb\x28\x42\xe5\x08\x42\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x8d\x30\x84\xf2\x5d\xef\xff\x5d\xef\xff\xb6\xb5\xfe\x69\x4a\x92\x08\x42\x18\x49\x4a\xed\x92\x94\xff\x08\x42\xe8\xc7\x39\x1a\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x5a\x6d\x6b\xee\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xae\x73\xea\xe7\x39\x33\x49\x4a\x75\x30\x84\xfc\x34\xa5\xff\x51\x8c\xfe"
+    "\x28\x42\xd3\x08\x42\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x16\x8a\x52\xe9\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x69\x4a\xe4\x00\x00\x01\x69\x4a"
+    "\xce\xba\xd6\xff\x55\xad\xff\x34\xa5\xff\x4d\x6b\xf7\x28\x42\x77\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xa5\xb6\xb5\xfc\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x79"
+    "\xce\xff\x8a\x52\xb6\x45\x29\x06\xaa\x52\xe8\x5d\xef\xff\x59\xce\xff\x34\xa5\xff\x14\xa5\xff\x08\x42\xe9\x49\x4a\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x08\xaa\x52\xe8\x5d\xef\xff"
+    "\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x34\xa5\xfc\x08\x42\x6c\xc7\x39\x38\xef\x7b\xec\x5d\xef\xff\x3c\xe7\xff\x34\xa5\xff\x34\xa5\xff\x0c\x63\xf4\xc7\x39\x46\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\xe7\x39\x43\x30\x84\xef\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xd3\x9c\xf4\xe7\x39\x4f\x49\x4a\x79\x75\xad\xfd\x5d\xef\xff\x5d\xef\xff\x96\xb5\xff\x34\xa5\xff\x10\x84\xff\x49\x4a\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x5e\x14\xa5\xfc\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xd3\x9c\xf6\x49\x4a\xe9\x49\x4a\xf2\xba\xd6\xff\x5d\xef\xff\x5d\xef\xff\xd7\xbd\xff\x34\xa5\xff\x92\x94\xff\x49\x4a\xb5\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x5a\xf3\x9c\xf9\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xb6\xb5\xff\x34\xa5\xff\x71\x8c\xff\x49\x4a\xb0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x27\x6d\x6b\xe9\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x55\xad\xff\x34\xa5\xff\xae\x73\xfb\x28\x42\x6c\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xdf\xfb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x34\xa5\xff"
+    "\x34\xa5\xff\x49\x4a\xed\x08\x42\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x5c\x30\x84\xf1\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\xb6\xb5\xff\x34\xa5\xff\xef\x7b\xfd\x49\x4a\xad\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x69\x4a\xc8\x18\xc6\xfd\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x59\xce\xff\x34\xa5\xff\x71\x8c\xff\x28\x42\xe4\x08\x42\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x47\x69\x4a\xd8\x69\x4a\xea"
+    "\xaa\x52\xfa\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\x8a\x52\xff\x69\x4a\xff\xe7\x39\xfb\x08\x42\xea\x28\x42\xd8\x08\x42\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a"
+    "\x8a\x6d\x6b\xed\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x75\xad\xff\xd3\x9c\xff\x8a\x52\xf1\x49\x4a\x8b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\xe7\x39\x3c\x6d\x6b\xed\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x34\xa5\xff\x34\xa5\xff\x8a\x52\xf1\xe7\x39\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x64\x34\xa5\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x55\xad\xff\x34\xa5\xff\xae\x73\xff\xe7\x39\x64\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x64\x34\xa5\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x55\xad\xff\x34\xa5\xff\xae"
+    "\x73\xff\xe7\x39\x64\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x56\x8a\x52\xe3\xcb\x5a\xdf\xaa\x52\xe1\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7"
+    "\x8a\x52\xe7\x49\x4a\xe7\x49\x4a\xe3\x28\x42\xe7\xc7\x39\x56\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t wB = {
   .header.always_zero = 0,
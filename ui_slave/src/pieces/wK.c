@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_WK
-uint8_t wK_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0xb4,0x69,0x4a,0xe4,0x69,0x4a,0xe4,0x49,0x4a,0xb6,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xd5,0x3c,0xe7,0xff,0x3c,0xe7,0xff,0x69,0x4a,0xd8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0xc2,0xaa,0x52,0xdb,0x8a,0x52,0xf0,0x3c,0xe7,0xff,0x3c,0xe7,0xff,0x8a,0x52,0xf1,0xaa,0x52,0xdb,0x49,0x4a,0xc2,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xdf,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x69,0x4a,0xdf,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xe0,0xf7,0xbd,0xff,0xf7,0xbd,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xf7,0xbd,0xff,0xf7,0xbd,0xff,0x69,0x4a,0xe1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x77,0x69,0x4a,0x98,0x69,0x4a,0xf0,0x5d,0xef,0xff,0x5d,0xef,0xff,0x69,0x4a,0xf0,0x69,0x4a,0x98,0x28,0x42,0x77,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x4e,0x8a,0x52,0xc4,0x8a,0x52,0xe3,0xaa,0x52,0xe4,0x69,0x4a,0xe4,0x8a,0x52,0xca,0x28,0x42,0x78,0x0c,0x63,0xe7,0x5d,0xef,0xff,0x5d,0xef,0xff,0x0c,0x63,0xe8,0x08,0x42,0x78,0x8a,0x52,0xca,0x49,0x4a,0xe6,0x49,0x4a,0xe9,0x28,0x42,0xe7,0x49,0x4a,0xca,0x08,0x42,0x50,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x04,0x69,0x4a,0xb2,0xcf,0x7b,0xee,0xba,0xd6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0xd3,0x9c,0xf8,0xf3,0x9c,0xf8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x14,0xa5,0xf8,0xf3,0x9c,0xf7,0xdb,0xde,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x96,0xb5,0xff,0xb2,0x94,0xff,0xeb,0x5a,0xf3,0x49,0x4a,0xb7,0x86,0x31,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x8f,0xb2,0x94,0xf5,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x3c,0xe7,0xff,0x75,0xad,0xff,0x34,0xa5,0xff,0x6d,0x6b,0xf8,0x49,0x4a,0x96,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xaa,0x52,0x03,0x8a,0x52,0xe8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x3c,0xe7,0xff,0x79,0xce,0xff,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x79,0xce,0xff,0x3c,0xe7,0xff,0x9a,0xd6,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x28,0x42,0xed,0x08,0x42,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x2a,0x8e,0x73,0xe9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x79,0xce,0xfe,0x8a,0x52,0xe6,0x8a,0x52,0xb3,0x8a,0x52,0xc9,0x69,0x4a,0xe2,0x8e,0x73,0xea,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x8e,0x73,0xea,0x69,0x4a,0xe2,0x8a,0x52,0xc9,0x8a,0x52,0xb3,0x8a,0x52,0xe6,0x18,0xc6,0xfe,0x34,0xa5,0xff,0x34,0xa5,0xff,0xcb,0x5a,0xee,0xc7,0x39,0x2c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x27,0x8e,0x73,0xe8,0x5d,0xef,0xff,0x5d,0xef,0xff,0xae,0x73,0xea,0xe7,0x39,0x32,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xae,0x38,0xc6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x38,0xc6,0xff,0x69,0x4a,0xae,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x36,0x8e,0x73,0xec,0x34,0xa5,0xff,0x34,0xa5,0xff,0xcb,0x5a,0xee,0xe7,0x39,0x2a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x07,0x8a,0x52,0xe7,0x5d,0xef,0xff,0x5d,0xef,0xff,0x92,0x94,0xf2,0x28,0x42,0x67,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x8a,0x52,0xd0,0xfb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x8a,0x52,0xd0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x59,0x10,0x84,0xf4,0x34,0xa5,0xff,0x34,0xa5,0xff,0x28,0x42,0xeb,0x08,0x42,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xa7,0xb6,0xb5,0xfc,0x5d,0xef,0xff,0x3c,0xe7,0xff,0xcb,0x5a,0xea,0x28,0x42,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xe4,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x69,0x4a,0xe4,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x24,0x69,0x4a,0xe4,0x55,0xad,0xff,0x34,0xa5,0xff,0x10,0x84,0xfe,0x49,0x4a,0xaf,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x16,0x8a,0x52,0xe6,0xdb,0xde,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x0c,0x63,0xeb,0x8a,0x52,0xaa,0xe7,0x39,0x50,0xcb,0x5a,0xe8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xcb,0x5a,0xe8,0x08,0x42,0x66,0x69,0x4a,0xb4,0xeb,0x5a,0xe9,0xb6,0xb5,0xff,0x34,0xa5,0xff,0xd3,0x9c,0xff,0x28,0x42,0xea,0xa6,0x31,0x17,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x3a,0xcb,0x5a,0xeb,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x18,0xc6,0xff,0xb2,0x94,0xf2,0xb6,0xb5,0xf9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xfa,0x55,0xad,0xfb,0x59,0xce,0xff,0xdb,0xde,0xff,0x34,0xa5,0xff,0x14,0xa5,0xff,0x28,0x42,0xef,0x08,0x42,0x3d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x5c,0x2c,0x63,0xed,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x1c,0xe7,0xff,0x55,0xad,0xff,0x14,0xa5,0xff,0x69,0x4a,0xf1,0x28,0x42,0x61,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x67,0x2c,0x63,0xec,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x1c,0xe7,0xff,0x55,0xad,0xff,0x14,0xa5,0xff,0x69,0x4a,0xf1,0x28,0x42,0x73,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x56,0x28,0x42,0xec,0xcb,0x5a,0xfe,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0x69,0x4a,0xff,0x08,0x42,0xff,0x08,0x42,0xff,0xe7,0x39,0xe9,0xe7,0x39,0x33,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xa5,0xcf,0x7b,0xef,0xfb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x55,0xad,0xff,0x92,0x94,0xff,0x49,0x4a,0xf0,0x49,0x4a,0x69,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x59,0x10,0x84,0xf0,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x34,0xa5,0xff,0x14,0xa5,0xff,0x49,0x4a,0xed,0xc7,0x39,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x8b,0xd7,0xbd,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x2c,0x63,0xf3,0xe7,0x39,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x8b,0xd7,0xbd,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x2c,0x63,0xf3,0xe7,0x39,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x74,0x69,0x4a,0xe6,0xaa,0x52,0xdb,0xaa,0x52,0xdd,0xcb,0x5a,0xdf,0x8a,0x52,0xe4,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0xaa,0x52,0xe4,0xaa,0x52,0xdf,0x28,0x42,0xe2,0x28,0x42,0xe2,0xe7,0x39,0xea,0xe7,0x39,0x3b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t wK_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\xb4\x69\x4a\xe4\x69\x4a\xe4\x49\x4a"
+    "\xb6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69"
+    "\x4a\xd5\x3c\xe7\xff\x3c\xe7\xff\x69\x4a\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x49\x4a\xc2\xaa\x52\xdb\x8a\x52\xf0\x3c\xe7\xff\x3c\xe7\xff\x8a\x52\xf1\xaa\x52\xdb\x49\x4a\xc2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xdf\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x69\x4a\xdf\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xe0\xf7\xbd\xff\xf7\xbd\xff\x5d\xef\xff\x5d\xef\xff\xf7\xbd\xff\xf7\xbd\xff\x69\x4a\xe1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x77\x69\x4a\x98\x69\x4a\xf0\x5d\xef\xff\x5d\xef\xff\x69\x4a\xf0\x69\x4a\x98\x28\x42\x77\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x4e\x8a\x52\xc4\x8a\x52\xe3\xaa\x52\xe4\x69\x4a\xe4\x8a\x52\xca\x28\x42\x78\x0c\x63\xe7\x5d\xef\xff\x5d\xef\xff\x0c\x63\xe8\x08\x42\x78\x8a\x52\xca\x49\x4a\xe6\x49\x4a\xe9\x28\x42\xe7\x49\x4a\xca\x08"
+    "\x42\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x04\x69\x4a\xb2\xcf\x7b\xee\xba\xd6\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\xd3\x9c\xf8\xf3\x9c\xf8\x5d\xef\xff\x5d\xef\xff\x14\xa5\xf8\xf3\x9c\xf7\xdb\xde\xff\x5d\xef\xff"
+    "\xfb\xde\xff\x96\xb5\xff\xb2\x94\xff\xeb\x5a\xf3\x49\x4a\xb7\x86\x31\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x8f\xb2\x94\xf5\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x3c\xe7\xff\x75\xad\xff\x34\xa5\xff\x6d\x6b\xf8\x49\x4a\x96\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xaa\x52\x03\x8a\x52\xe8\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x3c\xe7\xff\x79\xce\xff\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x79\xce\xff\x3c\xe7\xff\x9a\xd6\xff\x34\xa5\xff\x34\xa5\xff\x28\x42\xed\x08\x42\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x2a\x8e\x73\xe9\x5d\xef\xff\x5d\xef\xff\x79\xce\xfe\x8a\x52\xe6\x8a\x52\xb3"
+    "\x8a\x52\xc9\x69\x4a\xe2\x8e\x73\xea\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x8e\x73\xea\x69\x4a\xe2\x8a\x52\xc9\x8a\x52\xb3\x8a\x52\xe6\x18\xc6\xfe\x34\xa5\xff\x34\xa5\xff\xcb\x5a\xee\xc7\x39\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x27\x8e\x73\xe8\x5d\xef\xff\x5d\xef"
+    "\xff\xae\x73\xea\xe7\x39\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xae\x38\xc6\xff\x5d\xef\xff\x5d\xef\xff\x38\xc6\xff\x69\x4a\xae\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x36\x8e\x73\xec\x34\xa5\xff\x34\xa5\xff\xcb\x5a\xee\xe7\x39\x2a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49"
+    "\x4a\x07\x8a\x52\xe7\x5d\xef\xff\x5d\xef\xff\x92\x94\xf2\x28\x42\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8a\x52\xd0\xfb\xde\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x8a\x52\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x59\x10\x84\xf4\x34\xa5\xff\x34\xa5\xff\x28\x42\xeb\x08\x42\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xa7\xb6\xb5\xfc\x5d\xef\xff\x3c\xe7\xff\xcb\x5a\xea\x28\x42\x40\x00\x00\x00\x00\x00\x00\x69\x4a\xe4\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x69\x4a\xe4\x00\x00\x00\x00\x00\x00\xc7\x39\x24\x69\x4a\xe4\x55\xad\xff\x34\xa5\xff\x10\x84\xfe\x49\x4a\xaf\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x16\x8a\x52\xe6\xdb\xde\xff\x5d\xef\xff\xfb\xde\xff\x0c\x63\xeb\x8a\x52\xaa\xe7\x39\x50\xcb\x5a\xe8\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xcb\x5a\xe8\x08\x42\x66\x69\x4a\xb4\xeb\x5a\xe9\xb6\xb5\xff\x34\xa5\xff\xd3"
+    "\x9c\xff\x28\x42\xea\xa6\x31\x17\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x3a\xcb\x5a\xeb\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x18\xc6\xff\xb2\x94\xf2\xb6\xb5\xf9\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xb6\xb5\xfa\x55\xad\xfb\x59\xce\xff"
+    "\xdb\xde\xff\x34\xa5\xff\x14\xa5\xff\x28\x42\xef\x08\x42\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x5c\x2c\x63\xed\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\x5d\xef\xff\x1c\xe7\xff\x55\xad\xff\x14\xa5\xff\x69\x4a\xf1\x28\x42\x61\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x67\x2c\x63\xec\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x1c\xe7\xff\x55\xad\xff\x14\xa5\xff\x69\x4a\xf1\x28\x42\x73\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x56\x28\x42\xec\xcb\x5a\xfe"
+    "\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\x69\x4a\xff\x08\x42\xff\x08\x42\xff\xe7\x39\xe9\xe7\x39\x33\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a"
+    "\xa5\xcf\x7b\xef\xfb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x55\xad\xff\x92\x94\xff\x49\x4a\xf0\x49\x4a\x69\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x49\x4a\x59\x10\x84\xf0\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x34\xa5\xff\x14\xa5\xff\x49\x4a\xed\xc7\x39\x23\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x8b\xd7\xbd\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x34\xa5\xff\x34\xa5\xff\x2c\x63\xf3\xe7\x39\x44\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x8b\xd7\xbd\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x34\xa5\xff\x34\xa5\xff\x2c"
+    "\x63\xf3\xe7\x39\x44\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x74\x69\x4a\xe6\xaa\x52\xdb\xaa\x52\xdd\xcb\x5a\xdf\x8a\x52\xe4\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\xaa\x52\xe4"
+    "\xaa\x52\xdf\x28\x42\xe2\x28\x42\xe2\xe7\x39\xea\xe7\x39\x3b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t wK = {
   .header.always_zero = 0,
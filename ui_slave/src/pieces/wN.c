@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_WN
-uint8_t wN_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x1d,0x28,0x42,0xdc,0x08,0x42,0xe0,0x08,0x42,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x6c,0xd3,0x9c,0xfa,0x71,0x8c,0xfe,0x08,0x42,0xdf,0x28,0x42,0x0f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xc5,0xba,0xd6,0xff,0x9a,0xd6,0xff,0x10,0x84,0xfb,0x08,0x42,0xe5,0x49,0x4a,0xa1,0xe7,0x39,0x52,0x28,0x42,0x0b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x6c,0x6d,0x6b,0xed,0x5d,0xef,0xff,0x5d,0xef,0xff,0x1c,0xe7,0xff,0x59,0xce,0xff,0xf3,0x9c,0xff,0x4d,0x6b,0xf6,0x28,0x42,0xed,0x49,0x4a,0xab,0xc7,0x39,0x1b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x5e,0x2c,0x63,0xed,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x59,0xce,0xff,0x30,0x84,0xfe,0x28,0x42,0xed,0x28,0x42,0x62,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x15,0xaa,0x52,0xe7,0x3c,0xe7,0xff,0x3c,0xe7,0xff,0x10,0x84,0xec,0xd7,0xbd,0xf8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x34,0xa5,0xff,0x8a,0x52,0xf2,0x28,0x42,0x6c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x79,0x34,0xa5,0xfb,0x5d,0xef,0xff,0xcf,0x7b,0xee,0x08,0x42,0x98,0xef,0x7b,0xea,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xba,0xd6,0xff,0x14,0xa5,0xff,0x28,0x42,0xef,0xe7,0x39,0x29,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x69,0x4a,0xdf,0x1c,0xe7,0xff,0x9a,0xd6,0xff,0x08,0x42,0xf6,0x8a,0x52,0xe4,0xd3,0x9c,0xf3,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x96,0xb5,0xff,0x71,0x8c,0xff,0x49,0x4a,0xc4,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x5c,0x51,0x8c,0xf1,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x38,0xc6,0xff,0x34,0xa5,0xff,0x28,0x42,0xec,0x28,0x42,0x0b,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x19,0x8a,0x52,0xe6,0xfb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x96,0xb5,0xfe,0x79,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x79,0xce,0xff,0x34,0xa5,0xff,0x0c,0x63,0xf2,0xc7,0x39,0x3d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x0d,0x69,0x4a,0xd8,0x38,0xc6,0xfd,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x38,0xc6,0xfe,0xe7,0x39,0xfb,0x79,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x9a,0xd6,0xff,0x34,0xa5,0xff,0xcf,0x7b,0xfe,0x28,0x42,0x75,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x49,0x71,0x8c,0xf3,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x59,0xce,0xff,0x71,0x8c,0xf3,0x69,0x4a,0xda,0x28,0x42,0xee,0x1c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x79,0xce,0xff,0x34,0xa5,0xff,0xef,0x7b,0xff,0x49,0x4a,0x83,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x4e,0xb2,0x94,0xf4,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x9a,0xd6,0xff,0xcb,0x5a,0xea,0x8a,0x52,0xb0,0x08,0x42,0x5a,0x49,0x4a,0x88,0x92,0x94,0xf2,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x38,0xc6,0xff,0x34,0xa5,0xff,0xef,0x7b,0xff,0x28,0x42,0x86,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xa6,0x31,0x13,0x69,0x4a,0xe4,0xd7,0xbd,0xfd,0x5d,0xef,0xff,0xdb,0xde,0xff,0x8a,0x52,0xe7,0xe7,0x39,0x29,0x00,0x00,0x00,0x28,0x42,0x5a,0x2c,0x63,0xed,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xd7,0xbd,0xff,0x34,0xa5,0xff,0xae,0x73,0xfe,0x08,0x42,0x72,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x16,0x69,0x4a,0xa6,0xaa,0x52,0xe8,0x8a,0x52,0xe9,0xe7,0x39,0x39,0x00,0x00,0x00,0x08,0x42,0x3e,0xcb,0x5a,0xeb,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x75,0xad,0xff,0x34,0xa5,0xff,0x2c,0x63,0xf5,0xe7,0x39,0x48,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x09,0xc7,0x39,0x12,0x00,0x00,0x00,0xe7,0x39,0x26,0xaa,0x52,0xe8,0xfb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x1c,0xe7,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0xaa,0x52,0xed,0xc7,0x39,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x69,0x4a,0xd3,0x79,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x9a,0xd6,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x28,0x42,0xea,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x3c,0xef,0x7b,0xee,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xf7,0xbd,0xff,0x34,0xa5,0xff,0xb2,0x94,0xff,0x49,0x4a,0xc9,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x64,0x69,0x4a,0xe7,0xcb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0xeb,0x5a,0xff,0x8a,0x52,0xff,0x08,0x42,0xff,0x08,0x42,0xff,0x08,0x42,0xe7,0x08,0x42,0x47,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x69,0x4a,0xb4,0x10,0x84,0xf1,0x1c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x75,0xad,0xff,0xd3,0x9c,0xff,0x8a,0x52,0xf1,0x49,0x4a,0x8a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x6b,0x71,0x8c,0xf2,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x8a,0x52,0xf0,0xc7,0x39,0x38,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x9b,0x18,0xc6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x8e,0x73,0xfc,0xe7,0x39,0x5d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x9b,0x18,0xc6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x8e,0x73,0xfc,0xe7,0x39,0x5d,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x81,0x69,0x4a,0xe6,0x69,0x4a,0xe4,0xaa,0x52,0xdc,0xaa,0x52,0xdc,0xcb,0x5a,0xdf,0xaa,0x52,0xe3,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0xaa,0x52,0xe3,0xcb,0x5a,0xdf,0xaa,0x52,0xdb,0x28,0x42,0xe2,0x08,0x42,0xe8,0x08,0x42,0xea,0xe7,0x39,0x50,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t wN_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x1d\x28\x42\xdc\x08\x42\xe0\x08\x42\x18\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x6c\xd3\x9c\xfa\x71\x8c\xfe\x08"
+    "\x42\xdf\x28\x42\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x69\x4a\xc5\xba\xd6\xff\x9a\xd6\xff\x10\x84\xfb\x08\x42\xe5\x49\x4a\xa1\xe7\x39\x52\x28\x42\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x6c\x6d\x6b\xed\x5d\xef\xff\x5d\xef\xff\x1c\xe7\xff\x59\xce\xff\xf3\x9c\xff\x4d\x6b\xf6\x28\x42\xed\x49\x4a\xab\xc7\x39\x1b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x5e\x2c\x63\xed\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x59\xce\xff\x30\x84\xfe\x28\x42\xed\x28\x42\x62\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x15\xaa\x52\xe7\x3c\xe7\xff\x3c\xe7\xff\x10\x84\xec\xd7\xbd\xf8\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x34\xa5\xff\x8a\x52\xf2\x28\x42\x6c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x79\x34\xa5\xfb\x5d\xef\xff\xcf\x7b\xee\x08\x42\x98\xef\x7b\xea\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xba\xd6\xff\x14\xa5\xff\x28\x42\xef\xe7\x39\x29\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x69\x4a\xdf\x1c\xe7\xff\x9a\xd6\xff\x08\x42\xf6\x8a\x52\xe4\xd3\x9c\xf3\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff"
+    "\x96\xb5\xff\x71\x8c\xff\x49\x4a\xc4\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x5c\x51\x8c\xf1\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x38\xc6\xff\x34\xa5\xff\x28\x42\xec\x28\x42\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x19\x8a\x52\xe6\xfb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x96\xb5\xfe\x79\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x79\xce\xff\x34\xa5\xff\x0c\x63\xf2\xc7\x39\x3d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x0d\x69\x4a\xd8\x38\xc6\xfd\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff"
+    "\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x38\xc6\xfe\xe7\x39\xfb\x79\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x9a\xd6\xff\x34\xa5\xff\xcf\x7b\xfe\x28\x42\x75\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x49\x71\x8c\xf3\x5d\xef"
+    "\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x59\xce\xff\x71\x8c\xf3\x69\x4a\xda\x28\x42\xee\x1c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x79\xce\xff\x34\xa5\xff\xef\x7b\xff\x49\x4a\x83\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\xc7\x39\x4e\xb2\x94\xf4\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x9a\xd6\xff\xcb\x5a\xea\x8a\x52\xb0\x08\x42\x5a\x49\x4a\x88\x92\x94\xf2\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x38\xc6\xff\x34\xa5\xff\xef\x7b\xff\x28\x42\x86\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x31\x13\x69\x4a\xe4\xd7\xbd\xfd\x5d\xef\xff\xdb\xde\xff\x8a\x52\xe7\xe7\x39\x29\x00\x00\x00\x28\x42\x5a\x2c\x63\xed\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xd7\xbd\xff\x34\xa5\xff\xae\x73\xfe\x08\x42\x72\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x16\x69\x4a\xa6\xaa\x52\xe8\x8a\x52\xe9\xe7\x39\x39\x00\x00\x00\x08\x42\x3e\xcb\x5a\xeb\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x75\xad\xff\x34\xa5\xff\x2c\x63\xf5\xe7"
+    "\x39\x48\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x09\xc7\x39\x12\x00\x00\x00\xe7\x39\x26\xaa\x52\xe8\xfb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x1c\xe7\xff"
+    "\x34\xa5\xff\x34\xa5\xff\xaa\x52\xed\xc7\x39\x23\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x69\x4a\xd3\x79\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\x5d\xef\xff\x9a\xd6\xff\x34\xa5\xff\x34\xa5\xff\x28\x42\xea\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x3c\xef\x7b\xee\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xf7\xbd\xff\x34\xa5\xff\xb2\x94\xff\x49\x4a\xc9\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x64\x69\x4a\xe7"
+    "\xcb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\xeb\x5a\xff\x8a\x52\xff\x08\x42\xff\x08\x42\xff\x08\x42\xe7\x08\x42\x47\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x01\x69\x4a\xb4\x10\x84\xf1\x1c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x75\xad\xff\xd3\x9c\xff\x8a\x52\xf1\x49\x4a\x8a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x6b\x71\x8c\xf2\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x34\xa5\xff\x34\xa5\xff\x8a\x52\xf0\xc7\x39\x38\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x9b\x18\xc6\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x34\xa5\xff\x34\xa5\xff\x8e\x73\xfc\xe7\x39\x5d\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\x9b\x18\xc6\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x34\xa5\xff\x34"
+    "\xa5\xff\x8e\x73\xfc\xe7\x39\x5d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x81\x69\x4a\xe6\x69\x4a\xe4\xaa\x52\xdc\xaa\x52\xdc\xcb\x5a\xdf\xaa\x52\xe3\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\xaa\x52\xe3"
+    "\xcb\x5a\xdf\xaa\x52\xdb\x28\x42\xe2\x08\x42\xe8\x08\x42\xea\xe7\x39\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t wN = {
   .header.always_zero = 0,
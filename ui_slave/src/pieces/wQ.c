@@ -19,38 +19,41 @@
 
 static const
 LV_ATTRIBUTE_MEM_ALIGN LV_ATTRIBUTE_LARGE_CONST LV_ATTRIBUTE_WQ
-uint8_t wQ_map[] = {
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x16,0x8a,0x52,0xaa,0x69,0x4a,0xdc,0x8a,0x52,0xba,0xc7,0x39,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x24,0x8a,0x52,0xba,0x69,0x4a,0xdc,0x8a,0x52,0xa9,0xc7,0x39,0x16,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x45,0x29,0x06,0x69,0x4a,0xd9,0xd7,0xbd,0xfd,0x5d,0xef,0xff,0x59,0xce,0xff,0x69,0x4a,0xe3,0xc7,0x39,0x0d,0xa6,0x31,0x0e,0x69,0x4a,0xe4,0x59,0xce,0xff,0x5d,0xef,0xff,0xd7,0xbd,0xfd,0x69,0x4a,0xd9,0x86,0x31,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x3d,0x10,0x84,0xee,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xf3,0x9c,0xf8,0xe7,0x39,0x5c,0xe7,0x39,0x5e,0xf3,0x9c,0xf8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x10,0x84,0xed,0xe7,0x39,0x3c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x44,0x51,0x8c,0xf0,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xf3,0x9c,0xf9,0x08,0x42,0x5f,0x08,0x42,0x62,0xf3,0x9c,0xf9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x30,0x84,0xef,0xe7,0x39,0x43,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x25,0x28,0x42,0x69,0xe7,0x39,0x4f,0x86,0x31,0x05,0x49,0x4a,0x07,0x69,0x4a,0xdf,0x38,0xc6,0xff,0x5d,0xef,0xff,0x9a,0xd6,0xff,0x69,0x4a,0xe6,0x08,0x42,0x10,0xe7,0x39,0x11,0x69,0x4a,0xe6,0x9a,0xd6,0xff,0x5d,0xef,0xff,0x18,0xc6,0xfe,0x69,0x4a,0xde,0x45,0x29,0x06,0x86,0x31,0x05,0xe7,0x39,0x4f,0x28,0x42,0x69,0xc7,0x39,0x24,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x49,0x4a,0x5f,0xeb,0x5a,0xea,0x34,0xa5,0xfd,0x71,0x8c,0xf3,0x69,0x4a,0xd4,0xc7,0x39,0x09,0xe7,0x39,0x1e,0x49,0x4a,0xd6,0xd7,0xbd,0xff,0x18,0xc6,0xff,0x69,0x4a,0xb9,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xb9,0x18,0xc6,0xff,0xd7,0xbd,0xff,0x49,0x4a,0xd5,0xe7,0x39,0x1d,0x86,0x31,0x0a,0x69,0x4a,0xd4,0x71,0x8c,0xf4,0x34,0xa5,0xfd,0xeb,0x5a,0xea,0x49,0x4a,0x5c,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x69,0x4a,0xe7,0x3c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x14,0xa5,0xf8,0x49,0x4a,0x7a,0x00,0x00,0x00,0x49,0x4a,0x88,0xb6,0xb5,0xff,0x5d,0xef,0xff,0x0c,0x63,0xea,0xe7,0x39,0x25,0xe7,0x39,0x25,0x0c,0x63,0xea,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x49,0x4a,0x88,0x00,0x00,0x00,0x49,0x4a,0x7d,0x34,0xa5,0xf9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x3c,0xe7,0xff,0x8a,0x52,0xe6,0x00,0x00,0x02,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x14,0x2c,0x63,0xe7,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x79,0xce,0xff,0x8a,0x52,0xb1,0x00,0x00,0x00,0x49,0x4a,0x88,0xb6,0xb5,0xff,0x5d,0xef,0xff,0x18,0xc6,0xfe,0x69,0x4a,0xb2,0x69,0x4a,0xb2,0x18,0xc6,0xfe,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x49,0x4a,0x88,0x00,0x00,0x00,0x8a,0x52,0xb1,0x79,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x0c,0x63,0xe7,0x08,0x42,0x14,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xde,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb2,0x94,0xfa,0x08,0x42,0x9c,0x00,0x00,0x02,0x49,0x4a,0x88,0xb6,0xb5,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xeb,0x5a,0xea,0xeb,0x5a,0xea,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x49,0x4a,0x88,0x00,0x00,0x02,0x28,0x42,0x9d,0xb2,0x94,0xfa,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x69,0x4a,0xde,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x36,0x8a,0x52,0xe3,0xcf,0x7b,0xec,0xb6,0xb5,0xfb,0xdb,0xde,0xff,0x30,0x84,0xf0,0x69,0x4a,0xde,0x28,0x42,0xc2,0xb6,0xb5,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xf7,0xbd,0xfe,0xf7,0xbd,0xfe,0x5d,0xef,0xff,0x5d,0xef,0xff,0xb6,0xb5,0xff,0x28,0x42,0xc2,0x69,0x4a,0xdf,0x30,0x84,0xf0,0xdb,0xde,0xff,0xb6,0xb5,0xfb,0xcf,0x7b,0xec,0x8a,0x52,0xe3,0xe7,0x39,0x36,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x08,0xe7,0x39,0x3a,0xcb,0x5a,0xe9,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x71,0x8c,0xf5,0x18,0xc6,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x18,0xc6,0xff,0x71,0x8c,0xf5,0xfb,0xde,0xff,0x5d,0xef,0xff,0x1c,0xe7,0xff,0x49,0x4a,0xec,0xe7,0x39,0x3a,0x49,0x4a,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x8a,0x52,0xb8,0x59,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xd3,0x9c,0xff,0x49,0x4a,0xbc,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x3f,0xcf,0x7b,0xec,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x38,0xc6,0xff,0xcb,0x5a,0xf1,0xe7,0x39,0x3e,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0xe0,0x1c,0xe7,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xdb,0xde,0xff,0x14,0xa5,0xff,0x08,0x42,0xe5,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x28,0x42,0x7d,0x34,0xa5,0xf9,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x75,0xad,0xff,0xae,0x73,0xfb,0x28,0x42,0x7f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xa6,0x31,0x13,0xcb,0x5a,0xe8,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x18,0xc6,0xff,0x34,0xa5,0xff,0x28,0x42,0xed,0xe7,0x39,0x15,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x8a,0x52,0xbd,0x59,0xce,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x34,0xa5,0xff,0x71,0x8c,0xff,0x28,0x42,0xc1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xe7,0x39,0x43,0xef,0x7b,0xed,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x96,0xb5,0xff,0x34,0xa5,0xff,0xeb,0x5a,0xf2,0x08,0x42,0x43,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x42,0x43,0x69,0x4a,0xd7,0x8a,0x52,0xfb,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x8a,0x52,0xfc,0x69,0x4a,0xfc,0x08,0x42,0xfd,0xc7,0x39,0xfd,0xe7,0x39,0xfc,0x28,0x42,0xdb,0xe7,0x39,0x45,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x69,0x4a,0x87,0x6d,0x6b,0xed,0xdb,0xde,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x75,0xad,0xff,0xd3,0x9c,0xff,0x8a,0x52,0xf1,0x49,0x4a,0x8a,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x39,0x6d,0x6b,0xed,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0xfb,0xde,0xff,0x34,0xa5,0xff,0x34,0xa5,0xff,0x8a,0x52,0xf0,0xc7,0x39,0x39,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x5f,0x14,0xa5,0xfc,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0x8e,0x73,0xfd,0xc7,0x39,0x5f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x5f,0x14,0xa5,0xfc,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x5d,0xef,0xff,0x55,0xad,0xff,0x34,0xa5,0xff,0x8e,0x73,0xfd,0xc7,0x39,0x5f,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xc7,0x39,0x52,0x69,0x4a,0xe7,0x69,0x4a,0xe4,0x8a,0x52,0xde,0xaa,0x52,0xdb,0xcb,0x5a,0xdf,0xaa,0x52,0xe2,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0x8a,0x52,0xe7,0xaa,0x52,0xe3,0xcb,0x5a,0xdf,0xaa,0x52,0xdb,0x28,0x42,0xe2,0x08,0x42,0xe8,0x08,0x42,0xea,0xc7,0x39,0x52,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-};
+uint8_t wQ_map[] =
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x16\x8a\x52\xaa\x69\x4a\xdc\x8a\x52\xba\xc7\x39\x23\x00\x00\x00\x00\x00\x00\xc7\x39"
+    "\x24\x8a\x52\xba\x69\x4a\xdc\x8a\x52\xa9\xc7\x39\x16\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x45\x29\x06\x69\x4a\xd9\xd7\xbd\xfd\x5d\xef\xff\x59\xce\xff\x69"
+    "\x4a\xe3\xc7\x39\x0d\xa6\x31\x0e\x69\x4a\xe4\x59\xce\xff\x5d\xef\xff\xd7\xbd\xfd\x69\x4a\xd9\x86\x31\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x3d\x10\x84\xee"
+    "\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xf3\x9c\xf8\xe7\x39\x5c\xe7\x39\x5e\xf3\x9c\xf8\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x10\x84\xed\xe7\x39\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\xe7\x39\x44\x51\x8c\xf0\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xf3\x9c\xf9\x08\x42\x5f\x08\x42\x62\xf3\x9c\xf9\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x30\x84\xef\xe7\x39\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\xe7\x39\x25\x28\x42\x69\xe7\x39\x4f\x86\x31\x05\x49\x4a\x07\x69\x4a\xdf\x38\xc6\xff\x5d\xef\xff\x9a\xd6\xff\x69\x4a\xe6\x08\x42\x10\xe7\x39\x11\x69\x4a\xe6\x9a\xd6\xff\x5d\xef\xff\x18\xc6\xfe\x69\x4a\xde\x45\x29\x06\x86\x31\x05\xe7\x39\x4f\x28\x42\x69\xc7\x39\x24\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x49\x4a\x5f\xeb\x5a\xea\x34\xa5\xfd\x71\x8c\xf3\x69\x4a\xd4\xc7\x39\x09\xe7\x39\x1e\x49\x4a\xd6\xd7\xbd\xff\x18\xc6\xff\x69\x4a\xb9\x00\x00\x00\x00\x00\x00\x69\x4a\xb9\x18\xc6\xff\xd7\xbd\xff\x49\x4a\xd5\xe7\x39\x1d\x86\x31\x0a\x69\x4a\xd4\x71\x8c\xf4\x34\xa5\xfd\xeb\x5a\xea\x49\x4a"
+    "\x5c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x69\x4a\xe7\x3c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x14\xa5\xf8\x49\x4a\x7a\x00\x00\x00\x49\x4a\x88\xb6\xb5\xff\x5d\xef\xff\x0c\x63\xea\xe7\x39\x25\xe7\x39\x25\x0c\x63\xea\x5d\xef\xff\xb6\xb5\xff\x49\x4a\x88\x00\x00\x00\x49\x4a\x7d\x34\xa5\xf9\x5d"
+    "\xef\xff\x5d\xef\xff\x3c\xe7\xff\x8a\x52\xe6\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x14\x2c\x63\xe7\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x79\xce\xff\x8a\x52\xb1\x00\x00\x00\x49\x4a\x88\xb6\xb5\xff\x5d\xef\xff\x18\xc6\xfe\x69\x4a\xb2\x69\x4a\xb2\x18\xc6\xfe\x5d\xef\xff\xb6\xb5\xff\x49\x4a\x88"
+    "\x00\x00\x00\x8a\x52\xb1\x79\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x0c\x63\xe7\x08\x42\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xde\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\xb2\x94\xfa\x08\x42\x9c\x00\x00\x02\x49\x4a\x88\xb6\xb5\xff\x5d\xef\xff\x5d\xef\xff\xeb\x5a\xea\xeb\x5a\xea\x5d\xef"
+    "\xff\x5d\xef\xff\xb6\xb5\xff\x49\x4a\x88\x00\x00\x02\x28\x42\x9d\xb2\x94\xfa\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x69\x4a\xde\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x36\x8a\x52\xe3\xcf\x7b\xec\xb6\xb5\xfb\xdb\xde\xff\x30\x84\xf0\x69\x4a\xde\x28\x42\xc2\xb6\xb5\xff\x5d\xef\xff\x5d"
+    "\xef\xff\xf7\xbd\xfe\xf7\xbd\xfe\x5d\xef\xff\x5d\xef\xff\xb6\xb5\xff\x28\x42\xc2\x69\x4a\xdf\x30\x84\xf0\xdb\xde\xff\xb6\xb5\xfb\xcf\x7b\xec\x8a\x52\xe3\xe7\x39\x36\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x08\xe7\x39\x3a\xcb\x5a\xe9\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff"
+    "\x71\x8c\xf5\x18\xc6\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x18\xc6\xff\x71\x8c\xf5\xfb\xde\xff\x5d\xef\xff\x1c\xe7\xff\x49\x4a\xec\xe7\x39\x3a\x49\x4a\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8a\x52"
+    "\xb8\x59\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xd3\x9c\xff\x49\x4a\xbc\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x3f\xcf\x7b\xec\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x38\xc6\xff\xcb\x5a\xf1\xe7\x39\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a\xe0\x1c\xe7\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xdb\xde\xff\x14\xa5\xff\x08\x42\xe5\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x28\x42\x7d\x34\xa5\xf9\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x75\xad\xff\xae\x73\xfb\x28\x42\x7f\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa6\x31\x13\xcb\x5a\xe8\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x18\xc6\xff"
+    "\x34\xa5\xff\x28\x42\xed\xe7\x39\x15\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8a\x52\xbd\x59\xce\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef"
+    "\xff\x5d\xef\xff\xfb\xde\xff\x34\xa5\xff\x71\x8c\xff\x28\x42\xc1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe7\x39\x43\xef\x7b\xed\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d"
+    "\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x96\xb5\xff\x34\xa5\xff\xeb\x5a\xf2\x08\x42\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x42\x43\x69\x4a\xd7\x8a\x52\xfb"
+    "\x8a\x52\xfc\x8a\x52\xfc\x8a\x52\xfc\x8a\x52\xfc\x8a\x52\xfc\x8a\x52\xfc\x8a\x52\xfc\x69\x4a\xfc\x08\x42\xfd\xc7\x39\xfd\xe7\x39\xfc\x28\x42\xdb\xe7\x39\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x69\x4a"
+    "\x87\x6d\x6b\xed\xdb\xde\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x75\xad\xff\xd3\x9c\xff\x8a\x52\xf1\x49\x4a\x8a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\xc7\x39\x39\x6d\x6b\xed\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\xfb\xde\xff\x34\xa5\xff\x34\xa5\xff\x8a\x52\xf0\xc7\x39\x39\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x5f\x14\xa5\xfc\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x55\xad\xff\x34\xa5\xff\x8e\x73\xfd\xc7\x39\x5f\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x5f\x14\xa5\xfc\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x5d\xef\xff\x55\xad\xff\x34\xa5\xff\x8e"
+    "\x73\xfd\xc7\x39\x5f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc7\x39\x52\x69\x4a\xe7\x69\x4a\xe4\x8a\x52\xde\xaa\x52\xdb\xcb\x5a\xdf\xaa\x52\xe2\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\x8a\x52\xe7\xaa\x52\xe3\xcb\x5a\xdf"
+    "\xaa\x52\xdb\x28\x42\xe2\x08\x42\xe8\x08\x42\xea\xc7\x39\x52\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+    "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00";
 
 const lv_img_dsc_t wQ = {
   .header.always_zero = 0,